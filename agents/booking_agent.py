@@ -11,17 +11,32 @@ This agent:
 
 from typing import Dict, Any, List
 from datetime import date
-from api.amadeus_client import AmadeusClient
+import re
+from api.amadeus_client import get_amadeus_client
 from models.flight_models import (
     BookingRequest,
     BookingConfirmation,
     PassengerInfo,
     FlightOffer
 )
+from utils.exceptions import BookingCancelled
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# AADHAAR: 12 digits not starting with 0 or 1, optionally grouped by hyphens/spaces
+_AADHAAR_RE = re.compile(r'^\s*([2-9]\d{3})[-\s]?(\d{4})[-\s]?(\d{4})\s*$')
+
+# Demo AADHAAR used when the user presses Enter (must pass _AADHAAR_RE)
+DEMO_AADHAAR = "2345-6789-0123"
+
+# Government ID menu choices
+_ID_TYPES = {
+    "1": "AADHAAR",
+    "2": "PASSPORT",
+    "3": "DRIVING_LICENSE"
+}
+
 
 class BookingAgent:
     """
@@ -32,7 +47,7 @@ class BookingAgent:
 
     def __init__(self):
         """Initialize the agent with Amadeus client."""
-        self.amadeus_client = AmadeusClient()
+        self.amadeus_client = get_amadeus_client()
 
     def execute(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -47,8 +62,10 @@ class BookingAgent:
         logger.info("Booking Agent executing")
 
         try:
-            # Extract selected offer from state
-            selected_offer = FlightOffer.model_validate(state["selected_offer"])
+            # Extract selected offer from state (already a model unless restored from dicts)
+            selected_offer = state["selected_offer"]
+            if not isinstance(selected_offer, FlightOffer):
+                selected_offer = FlightOffer.model_validate(selected_offer)
 
             # Collect passenger information
             passengers = self._collect_passenger_info(state)
@@ -68,9 +85,9 @@ class BookingAgent:
             booking_confirmation.total_price = selected_offer.price
             booking_confirmation.currency = selected_offer.currency
 
-            # Store in state
-            state["booking_confirmation"] = booking_confirmation.model_dump()
-            state["passengers"] = [p.model_dump() for p in passengers]
+            # Store in state (models are kept as-is; the checkpointer serializes them)
+            state["booking_confirmation"] = booking_confirmation
+            state["passengers"] = passengers
 
             logger.info(
                 f"Booking completed successfully. Reference: {booking_confirmation.booking_reference}"
@@ -80,6 +97,9 @@ class BookingAgent:
 
             return state
 
+        except BookingCancelled:
+            raise
+
         except Exception as e:
             logger.error(f"Error in Booking Agent: {e}")
             state["error"] = str(e)
@@ -114,6 +134,8 @@ class BookingAgent:
         print("="*70)
         print("Please enter passenger details:")
         print("💡 Tip: You can type 'cancel' at any time to exit the program")
+        print("⚡ Quick entry: type all fields on one line as")
+        print("   First,Last,Gender,Email,Phone,IDType(1/2/3),IDNumber  (blank fields use defaults)")
         print()
 
         for i in range(adults):
@@ -123,7 +145,14 @@ class BookingAgent:
             first_name = input("  First Name (or 'cancel' to exit) [Demo: press Enter]: ").strip()
             if first_name.lower() in ['cancel', 'exit', 'quit']:
                 print("\n🚪 Booking cancelled by user. Thank you for using AI Ticket Booking!")
-                raise KeyboardInterrupt("User cancelled during passenger information collection")
+                raise BookingCancelled("User cancelled during passenger information collection")
+
+            # Quick entry: whole passenger on one comma-separated line
+            if "," in first_name:
+                passengers.append(self._parse_passenger_line(first_name))
+                print()
+                continue
+
             first_name = first_name or "John"
 
             last_name = input("  Last Name [Demo: press Enter]: ").strip() or "Doe"
@@ -136,12 +165,7 @@ class BookingAgent:
             print("  Options: 1=AADHAAR, 2=PASSPORT, 3=DRIVING_LICENSE")
             id_choice = input("  Select ID Type (1/2/3) [1]: ").strip() or "1"
 
-            id_type_map = {
-                "1": "AADHAAR",
-                "2": "PASSPORT",
-                "3": "DRIVING_LICENSE"
-            }
-            id_type = id_type_map.get(id_choice, "AADHAAR")
+            id_type = _ID_TYPES.get(id_choice, "AADHAAR")
 
             # Get ID number with format validation
             if id_type == "AADHAAR":
@@ -150,7 +174,7 @@ class BookingAgent:
                 id_number = input(f"  {id_type} Number (or 'cancel' to exit): ").strip()
                 if id_number.lower() in ['cancel', 'exit', 'quit']:
                     print("\n🚪 Booking cancelled by user. Thank you for using AI Ticket Booking!")
-                    raise KeyboardInterrupt("User cancelled during ID collection")
+                    raise BookingCancelled("User cancelled during ID collection")
                 id_number = id_number or "DEFAULT123456"
 
             passenger = PassengerInfo(
@@ -170,6 +194,61 @@ class BookingAgent:
 
         return passengers
 
+    def _parse_passenger_line(self, line: str) -> PassengerInfo:
+        """
+        Build a passenger from a single comma-separated quick-entry line.
+
+        Format: First,Last,Gender,Email,Phone,IDType(1/2/3),IDNumber.
+        Missing or blank fields fall back to the same demo defaults as the
+        per-field prompts. A line with extra fields or an invalid AADHAAR
+        number is re-prompted.
+
+        Args:
+            line: Raw comma-separated input
+
+        Returns:
+            PassengerInfo object
+        """
+        fields = [field.strip() for field in line.split(",")]
+
+        # Re-prompt rather than silently dropping anything past the 7th field
+        while len(fields) > 7:
+            print(f"  ❌ Quick entry has {len(fields)} fields, expected at most 7. Please re-enter the line.")
+            line = input("  Quick entry (or 'cancel' to exit): ").strip()
+            if line.lower() in ['cancel', 'exit', 'quit']:
+                print("\n🚪 Booking cancelled by user. Thank you for using AI Ticket Booking!")
+                raise BookingCancelled("User cancelled during passenger information collection")
+            fields = [field.strip() for field in line.split(",")]
+
+        fields += [""] * (7 - len(fields))
+        first_name, last_name, gender, email, phone, id_choice, id_number = fields
+
+        id_type = _ID_TYPES.get(id_choice or "1", "AADHAAR")
+
+        if id_type == "AADHAAR":
+            match = _AADHAAR_RE.match(id_number) if id_number else None
+            if match:
+                id_number = "-".join(match.groups())
+            elif id_number:
+                print("  ❌ Invalid AADHAAR in quick entry, please re-enter it.")
+                id_number = self._get_aadhaar_number()
+            else:
+                id_number = DEMO_AADHAAR
+        else:
+            id_number = id_number or "DEFAULT123456"
+
+        gender = gender.upper()
+
+        return PassengerInfo(
+            first_name=first_name or "John",
+            last_name=last_name or "Doe",
+            gender=gender if gender in ["M", "F"] else "M",
+            email=email or "john.doe@example.com",
+            phone=phone or "+91-1234567890",
+            id_type=id_type,
+            id_number=id_number
+        )
+
     def _get_aadhaar_number(self) -> str:
         """
         Get and validate Aadhaar number in format: 0000-0000-0000
@@ -182,19 +261,17 @@ class BookingAgent:
 
             # Default for demo
             if not aadhaar:
-                return "1234-5678-9012"
-
-            # Remove any existing hyphens or spaces
-            aadhaar_digits = aadhaar.replace("-", "").replace(" ", "")
+                return DEMO_AADHAAR
 
-            # Validate: must be exactly 12 digits
-            if len(aadhaar_digits) == 12 and aadhaar_digits.isdigit():
+            # Validate: 12 digits, first digit 2-9, with or without separators
+            match = _AADHAAR_RE.match(aadhaar)
+            if match:
                 # Format as 0000-0000-0000
-                formatted = f"{aadhaar_digits[:4]}-{aadhaar_digits[4:8]}-{aadhaar_digits[8:]}"
+                formatted = "-".join(match.groups())
                 print(f"  ✓ Formatted: {formatted}")
                 return formatted
             else:
-                print("  ❌ Invalid! AADHAAR must be 12 digits. Example: 1234-5678-9012")
+                print("  ❌ Invalid! AADHAAR must be 12 digits, not starting with 0 or 1. Example: 2345-6789-0123")
                 print("     You can enter with or without hyphens.")
 
     def _use_demo_passengers(self, num_passengers: int = 1) -> List[PassengerInfo]:
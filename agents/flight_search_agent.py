@@ -13,19 +13,19 @@ This agent is the first in the booking workflow. It:
 from typing import Dict, Any
 from datetime import datetime, date, time
 from pydantic import BaseModel, Field
+import asyncio
 import json
-from openai import OpenAI
 
-from api.openai_client import OpenAIClient
-from api.amadeus_client import AmadeusClient
+from api.openai_client import get_openai_client, get_shared_async_openai, strict_json_schema
+from api.amadeus_client import get_amadeus_client
 from models.flight_models import FlightSearchRequest, FlightSearchResponse
 from tools.airport_lookup_tool import AIRPORT_TOOLS, TOOL_FUNCTIONS
+from utils.exceptions import BookingCancelled
 from utils.logger import setup_logger
 from config import settings
 
 logger = setup_logger(__name__)
 
-
 class ParsedFlightRequest(BaseModel):
     """Structured output from LLM parsing user request."""
 
@@ -45,6 +45,59 @@ class ParsedFlightRequest(BaseModel):
     )
 
 
+# System prompt for parsing flight requests (static, shared by every call)
+_PARSE_SYSTEM_PROMPT = """You are a flight booking assistant with access to airport lookup tools.
+
+Your task:
+1. Identify origin and destination cities from the user request
+2. Use the 'get_primary_airports_batch' tool to find IATA codes for both cities
+3. Extract departure date and time (if specified)
+4. Determine number of passengers and travel class (if specified)
+
+Date handling:
+- "today" = current date
+- "tomorrow" = current date + 1 day
+- "next Monday/Tuesday/etc" = next occurrence of that day
+- Specific dates should be in YYYY-MM-DD format
+
+Time handling (use null if not specified):
+- "early morning" / "morning" = null (let system find morning flights)
+- "afternoon" / "evening" / "night" = null (time preference, not specific time)
+- Specific time "3 PM" / "15:00" = convert to "15:00" in 24-hour format
+- No time mentioned = null
+
+Steps:
+1. Call get_primary_airports_batch ONCE with both the origin and destination cities
+2. After you have both IATA codes, respond with ONLY a JSON object (no markdown, no explanation)
+
+CRITICAL: Your final response must be ONLY a JSON object with these exact fields:
+{
+  "origin_city": "City name",
+  "origin_code": "IATA code from tool",
+  "destination_city": "City name",
+  "destination_code": "IATA code from tool",
+  "departure_date": "YYYY-MM-DD",
+  "departure_time": null,
+  "adults": 1,
+  "travel_class": "ECONOMY"
+}
+
+IMPORTANT: 
+- Use null (not "null" string) for departure_time if no specific time is mentioned
+- Only use "HH:MM" format if user specifies exact time like "3 PM" or "15:00"
+- For time preferences like "morning" or "afternoon", use null
+
+Do not include any explanation, markdown formatting, or additional text. Return ONLY the JSON object."""
+
+_PARSE_SYSTEM_MESSAGE = {"role": "system", "content": _PARSE_SYSTEM_PROMPT}
+
+# Structured Outputs format guaranteeing a valid ParsedFlightRequest JSON object
+PARSED_REQUEST_FORMAT = {
+    "type": "json_schema",
+    "json_schema": strict_json_schema(ParsedFlightRequest)
+}
+
+
 class FlightSearchAgent:
     """
     Agent 1: Parses user requests and searches for flights.
@@ -54,15 +107,15 @@ class FlightSearchAgent:
 
     def __init__(self):
         """Initialize the agent with API clients and tools."""
-        self.openai_client = OpenAIClient()
-        self.amadeus_client = AmadeusClient()
+        self.openai_client = get_openai_client()
+        self.amadeus_client = get_amadeus_client()
         self.tools = AIRPORT_TOOLS  # Airport lookup tools
-        self.tool_functions = TOOL_FUNCTIONS  # Function mappings
+        self.tool_functions = TOOL_FUNCTIONS  # Function mappings (memoized in the tool module)
 
-        # Direct OpenAI client for function calling
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        # Direct async OpenAI client for function calling
+        self.client = get_shared_async_openai()
 
-    def execute(self, user_prompt: str, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute(self, user_prompt: str, state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute the flight search agent logic.
 
@@ -75,7 +128,7 @@ class FlightSearchAgent:
         """
         try:
             # Step 1: Parse user request using LLM
-            parsed_request = self._parse_user_request(user_prompt)
+            parsed_request = await self._parse_user_request(user_prompt)
             logger.debug(
                 f"Parsed request: {parsed_request.origin_code} -> "
                 f"{parsed_request.destination_code} on {parsed_request.departure_date}"
@@ -84,12 +137,15 @@ class FlightSearchAgent:
             # Step 2: Convert to FlightSearchRequest
             search_request = self._create_search_request(parsed_request)
 
-            # Step 3: Search flights using Amadeus API
-            flight_results = self.amadeus_client.search_flights(search_request)
+            # Step 3: Search flights using Amadeus API (blocking SDK, run off the event loop)
+            flight_results = await asyncio.to_thread(
+                self.amadeus_client.search_flights,
+                search_request
+            )
 
             # Step 4: Update state with results
             state["parsed_request"] = parsed_request.model_dump()
-            state["flight_results"] = flight_results.model_dump()
+            state["flight_results"] = flight_results
             state["search_request"] = search_request.model_dump()
             state["user_prompt"] = user_prompt
 
@@ -100,12 +156,15 @@ class FlightSearchAgent:
 
             return state
 
+        except BookingCancelled:
+            raise
+
         except Exception as e:
             logger.error(f"Error in Flight Search Agent: {e}")
             state["error"] = str(e)
             raise
 
-    def _parse_user_request(self, user_prompt: str) -> ParsedFlightRequest:
+    async def _parse_user_request(self, user_prompt: str) -> ParsedFlightRequest:
         """
         Use LLM with tool calling to parse natural language flight request.
 
@@ -122,194 +181,116 @@ class FlightSearchAgent:
             - "I need to fly from LAX to JFK tomorrow at 3 PM"
             - "Find flights from Paris to Tokyo next Monday"
         """
-        system_prompt = """You are a flight booking assistant with access to airport lookup tools.
-
-Your task:
-1. Identify origin and destination cities from the user request
-2. Use the 'get_primary_airport' tool to find IATA codes for both cities
-3. Extract departure date and time (if specified)
-4. Determine number of passengers and travel class (if specified)
-
-Date handling:
-- "today" = current date
-- "tomorrow" = current date + 1 day
-- "next Monday/Tuesday/etc" = next occurrence of that day
-- Specific dates should be in YYYY-MM-DD format
-
-Time handling (use null if not specified):
-- "early morning" / "morning" = null (let system find morning flights)
-- "afternoon" / "evening" / "night" = null (time preference, not specific time)
-- Specific time "3 PM" / "15:00" = convert to "15:00" in 24-hour format
-- No time mentioned = null
-
-Steps:
-1. First, call get_primary_airport for the origin city
-2. Then, call get_primary_airport for the destination city
-3. After you have both IATA codes, respond with ONLY a JSON object (no markdown, no explanation)
-
-CRITICAL: Your final response must be ONLY a JSON object with these exact fields:
-{
-  "origin_city": "City name",
-  "origin_code": "IATA code from tool",
-  "destination_city": "City name",
-  "destination_code": "IATA code from tool",
-  "departure_date": "YYYY-MM-DD",
-  "departure_time": null,
-  "adults": 1,
-  "travel_class": "ECONOMY"
-}
-
-IMPORTANT: 
-- Use null (not "null" string) for departure_time if no specific time is mentioned
-- Only use "HH:MM" format if user specifies exact time like "3 PM" or "15:00"
-- For time preferences like "morning" or "afternoon", use null
-
-Do not include any explanation, markdown formatting, or additional text. Return ONLY the JSON object."""
-
         messages = [
-            {
-                "role": "system", 
-                "content": system_prompt},
+            _PARSE_SYSTEM_MESSAGE,
             {
                 "role": "user",
                 "content": f"Current date: {datetime.now().strftime('%Y-%m-%d')}\n\nUser request: {user_prompt}"
             }
         ]
 
-        # Run conversation with tool calls
-        max_iterations = 10
-        iteration = 0
-
-        while iteration < max_iterations:
-            iteration += 1
-
-            # Check if we should use JSON mode (no tools needed anymore)
-            use_json_mode = iteration > 2 and not any(
-                msg.get("role") == "tool" for msg in messages[-3:] if isinstance(msg, dict)
-            )
+        # Tool-calling turn(s) followed by one structured-output turn
+        max_iterations = 3
+
+        for iteration in range(1, max_iterations + 1):
+            # Every call is constrained to the ParsedFlightRequest schema; tools are
+            # withheld on the last iteration so the model must answer
+            request_args = {
+                "model": settings.openai_model,
+                "messages": messages,
+                "temperature": 0.3,
+                "response_format": PARSED_REQUEST_FORMAT
+            }
+            if iteration < max_iterations:
+                request_args["tools"] = self.tools
+                request_args["tool_choice"] = "auto"
 
-            # Call OpenAI with tools
-            if use_json_mode:
-                # Final call with JSON mode, no tools
-                response = self.client.chat.completions.create(
-                    model=settings.openai_model,
-                    messages=messages,
-                    temperature=0.3,
-                    response_format={"type": "json_object"}
-                )
-            else:
-                # Regular call with tools
-                response = self.client.chat.completions.create(
-                    model=settings.openai_model,
-                    messages=messages,
-                    tools=self.tools,
-                    tool_choice="auto",
-                    temperature=0.3
-                )
+            response = await self.client.chat.completions.create(**request_args)
 
             response_message = response.choices[0].message
             messages.append(response_message)
 
             # Check if the model wants to call tools
-            if response_message.tool_calls and not use_json_mode:
+            if response_message.tool_calls:
                 logger.debug(f"Agent is calling {len(response_message.tool_calls)} tool(s)...")
 
-                # Execute each tool call
+                # Dispatch all tool calls from this turn concurrently
+                tool_calls = []
                 for tool_call in response_message.tool_calls:
-                    function_name = tool_call.function.name
-                    function_args = json.loads(tool_call.function.arguments)
-
-                    logger.debug(f"Calling tool: {function_name} with args: {function_args}")
-
-                    # Execute the tool function
-                    if function_name in self.tool_functions:
-                        function_response = self.tool_functions[function_name](**function_args)
-                        logger.debug(f"Tool response: {function_response}")
-
-                        # Add tool response to messages
-                        messages.append({
-                            "tool_call_id": tool_call.id,
-                            "role": "tool",
-                            "name": function_name,
-                            "content": str(function_response)
-                        })
+                    if tool_call.function.name in self.tool_functions:
+                        tool_calls.append(tool_call)
                     else:
-                        logger.warning(f"Unknown tool: {function_name}")
-
-            else:
-                # No more tool calls - agent has final response
-                final_content = response_message.content
-                logger.debug(f"Agent finished with final response")
-
-                # Parse the JSON response into our model
-                try:
-                    # Try to parse as pure JSON first
-                    parsed_data = json.loads(final_content)
-                    
-                    # Validate that required fields are not None
-                    required_fields = ["origin_code", "destination_code", "departure_date"]
-                    missing_or_none = [field for field in required_fields if not parsed_data.get(field)]
-                    
-                    if missing_or_none:
-                        error_msg = f"LLM returned None/missing values for: {', '.join(missing_or_none)}"
-                        logger.error(f"{error_msg}. Response: {final_content}")
-                        
-                        # If we still have iterations left, ask for clarification
-                        if iteration < max_iterations - 1:
-                            messages.append({
-                                "role": "user",
-                                "content": f"Error: {error_msg}. Please use the airport lookup tools to find the correct IATA codes and provide all required fields."
-                            })
-                            continue
-                        else:
-                            raise ValueError(
-                                f"Could not parse flight request. {error_msg}. "
-                                f"Please provide origin city, destination city, and departure date clearly. "
-                                f"Example: 'Book a flight from Mumbai to Delhi on November 20th'"
-                            )
-                    
-                    parsed = ParsedFlightRequest.model_validate(parsed_data)
-                    return parsed
-                except json.JSONDecodeError:
-                    # If not pure JSON, try to extract JSON from markdown or text
-                    logger.warning("Response is not pure JSON, attempting to extract...")
-
-                    # Try to find JSON in code blocks
-                    import re
-                    json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', final_content, re.DOTALL)
-                    if json_match:
-                        try:
-                            parsed_data = json.loads(json_match.group(1))
-                            parsed = ParsedFlightRequest.model_validate(parsed_data)
-                            return parsed
-                        except:
-                            pass
-
-                    # Try to find raw JSON object
-                    json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', final_content, re.DOTALL)
-                    if json_match:
-                        try:
-                            parsed_data = json.loads(json_match.group(0))
-                            parsed = ParsedFlightRequest.model_validate(parsed_data)
-                            return parsed
-                        except:
-                            pass
-
-                    # Last resort: ask for JSON explicitly using JSON mode
-                    if iteration < max_iterations - 1:
-                        logger.warning("Could not extract JSON, requesting explicit JSON format...")
-                        messages.append({
-                            "role": "user",
-                            "content": "Please provide ONLY the JSON object with flight details, no explanation or formatting."
-                        })
-                        continue
-
-                    # If we're on last iteration, try to construct manually
-                    logger.error(f"Failed to extract JSON from response: {final_content[:200]}")
-                    raise json.JSONDecodeError("Could not extract valid JSON", final_content, 0)
+                        logger.warning(f"Unknown tool: {tool_call.function.name}")
+
+                function_responses = await asyncio.gather(
+                    *(self._run_tool_call(tool_call) for tool_call in tool_calls)
+                )
+
+                # Add tool responses to messages in call order
+                for tool_call, function_response in zip(tool_calls, function_responses):
+                    messages.append({
+                        "tool_call_id": tool_call.id,
+                        "role": "tool",
+                        "name": tool_call.function.name,
+                        "content": str(function_response)
+                    })
+
+                continue
+
+            # No more tool calls - agent has final, schema-conforming response
+            logger.debug(f"Agent finished with final response")
+
+            final_content = response_message.content
+            if not final_content:
+                raise ValueError(
+                    f"Could not parse flight request: {getattr(response_message, 'refusal', None) or 'empty response'}"
+                )
+
+            parsed = ParsedFlightRequest.model_validate_json(final_content)
+
+            # Validate that required fields are not empty
+            required_fields = ["origin_code", "destination_code", "departure_date"]
+            missing = [field for field in required_fields if not getattr(parsed, field)]
+
+            if missing:
+                error_msg = f"LLM returned empty values for: {', '.join(missing)}"
+                logger.error(f"{error_msg}. Response: {final_content}")
+                raise ValueError(
+                    f"Could not parse flight request. {error_msg}. "
+                    f"Please provide origin city, destination city, and departure date clearly. "
+                    f"Example: 'Book a flight from Mumbai to Delhi on November 20th'"
+                )
+
+            return parsed
 
         raise Exception("Failed to parse user request after maximum iterations")
 
+    async def _run_tool_call(self, tool_call) -> Any:
+        """
+        Execute a single tool call in a worker thread.
+
+        The airport tools use the blocking Amadeus SDK, so they are run via
+        asyncio.to_thread to let multiple lookups proceed in parallel.
+
+        Args:
+            tool_call: Tool call emitted by the model
+
+        Returns:
+            Raw tool function response
+        """
+        function_name = tool_call.function.name
+        function_args = json.loads(tool_call.function.arguments)
+
+        logger.debug(f"Calling tool: {function_name} with args: {function_args}")
+
+        function_response = await asyncio.to_thread(
+            self.tool_functions[function_name],
+            **function_args
+        )
+        logger.debug(f"Tool response: {function_response}")
+
+        return function_response
+
     def _create_search_request(self, parsed: ParsedFlightRequest) -> FlightSearchRequest:
         """
         Convert parsed request to FlightSearchRequest model.
@@ -360,7 +341,7 @@ if __name__ == "__main__":
     test_prompt = "I need to fly from New York to Los Angeles on 2025-11-15"
 
     state = {}
-    result = agent.execute(test_prompt, state)
+    result = asyncio.run(agent.execute(test_prompt, state))
 
     print("\n" + "="*50)
     print("FLIGHT SEARCH RESULTS")
@@ -368,4 +349,4 @@ if __name__ == "__main__":
     print(f"Origin: {result['parsed_request']['origin_city']} ({result['parsed_request']['origin_code']})")
     print(f"Destination: {result['parsed_request']['destination_city']} ({result['parsed_request']['destination_code']})")
     print(f"Date: {result['parsed_request']['departure_date']}")
-    print(f"Flights found: {len(result['flight_results']['original_date_offers'])}")
+    print(f"Flights found: {len(result['flight_results'].original_date_offers)}")
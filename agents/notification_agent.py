@@ -9,12 +9,25 @@ This agent:
 5. (In production: would send email, SMS, save to database)
 """
 
+import sys
+from datetime import datetime
 from typing import Dict, Any
-from api.openai_client import OpenAIClient
+from api.openai_client import get_openai_client
+from models.flight_models import BookingConfirmation
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Console decorations, built once at import time
+_RULE = "─" * 80 + "\n"
+_BANNER = "\n\n\n" + "\n".join([
+    "╔" + "═" * 78 + "╗",
+    "║" + " " * 78 + "║",
+    "║" + "         🎉 BOOKING CONFIRMED - YOUR TICKET IS READY! 🎉         ".center(78) + "║",
+    "║" + " " * 78 + "║",
+    "╚" + "═" * 78 + "╝",
+]) + "\n\n\n"
+
 
 class NotificationAgent:
     """
@@ -26,7 +39,7 @@ class NotificationAgent:
 
     def __init__(self):
         """Initialize the agent with OpenAI client."""
-        self.openai_client = OpenAIClient()
+        self.openai_client = get_openai_client()
 
     def execute(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -43,14 +56,16 @@ class NotificationAgent:
         try:
             # Extract formatted ticket from state
             formatted_ticket = state.get("formatted_ticket", "")
-            booking_confirmation = state.get("booking_confirmation", {})
+            booking_confirmation = state["booking_confirmation"]
+            if not isinstance(booking_confirmation, BookingConfirmation):
+                booking_confirmation = BookingConfirmation.model_validate(booking_confirmation)
 
             # Display the ticket to user
             self._display_ticket(formatted_ticket, booking_confirmation)
 
             # Mark workflow as complete
             state["workflow_complete"] = True
-            state["completion_time"] = str(__import__('datetime').datetime.now())
+            state["completion_time"] = datetime.now().isoformat()
 
             logger.info("Notification sent successfully. Workflow complete.")
 
@@ -64,7 +79,7 @@ class NotificationAgent:
     def _display_ticket(
         self,
         formatted_ticket: str,
-        booking_confirmation: Dict[str, Any]
+        booking_confirmation: BookingConfirmation
     ) -> None:
         """
         Display the ticket to the user with confirmation message.
@@ -80,44 +95,34 @@ class NotificationAgent:
             formatted_ticket: The formatted ticket string
             booking_confirmation: Booking details
         """
-        print("\n\n")
-        print("╔" + "═" * 78 + "╗")
-        print("║" + " " * 78 + "║")
-        print("║" + "         🎉 BOOKING CONFIRMED - YOUR TICKET IS READY! 🎉         ".center(78) + "║")
-        print("║" + " " * 78 + "║")
-        print("╚" + "═" * 78 + "╝")
-        print("\n")
-
-        # Display the formatted ticket
-        print(formatted_ticket)
-
-        print("\n")
-        print("─" * 80)
+        # Banner and the formatted ticket in a single write
+        sys.stdout.write(f"{_BANNER}{formatted_ticket}\n\n\n{_RULE}")
 
-        # Additional confirmation message
-        confirmation_message = self._generate_confirmation_message(booking_confirmation)
-        print(confirmation_message)
+        # Additional confirmation message (printed as it streams in)
+        self._generate_confirmation_message(booking_confirmation)
 
-        print("─" * 80)
-        print("\n")
+        sys.stdout.write(f"{_RULE}\n\n")
 
         # In production, save ticket or send via email
         self._mock_email_notification(booking_confirmation)
 
     def _generate_confirmation_message(
         self,
-        booking_confirmation: Dict[str, Any]
+        booking_confirmation: BookingConfirmation
     ) -> str:
         """
         Generate a friendly confirmation message using LLM.
 
+        The message is streamed to stdout as it is generated so the user
+        sees it at time-to-first-token.
+
         Args:
             booking_confirmation: Booking details
 
         Returns:
             Confirmation message string
         """
-        booking_ref = booking_confirmation.get("booking_reference", "N/A")
+        booking_ref = booking_confirmation.booking_reference
 
         instruction = """Generate a brief, friendly confirmation message for a flight booking.
 
@@ -132,18 +137,25 @@ Keep it warm, professional, and concise (3-4 sentences)."""
 
         data = {
             "booking_reference": booking_ref,
-            "status": booking_confirmation.get("status", "CONFIRMED")
+            "status": booking_confirmation.status
         }
 
-        message = self.openai_client.format_response(
+        chunks = []
+        for chunk in self.openai_client.stream_response(
             data=data,
             format_instruction=instruction,
             temperature=0.7
-        )
+        ):
+            print(chunk, end="", flush=True)
+            chunks.append(chunk)
+        print()
+
+        message = "".join(chunks)
+        logger.debug(f"Streamed confirmation message: {len(message)} characters")
 
         return message
 
-    def _mock_email_notification(self, booking_confirmation: Dict[str, Any]) -> None:
+    def _mock_email_notification(self, booking_confirmation: BookingConfirmation) -> None:
         """
         Simulate sending email notification.
 
@@ -155,12 +167,12 @@ Keep it warm, professional, and concise (3-4 sentences)."""
         Args:
             booking_confirmation: Booking details
         """
-        passengers = booking_confirmation.get("passengers", [])
-        emails = [p.get("email") for p in passengers if p.get("email")]
+        # Join once; an empty string means no passenger has an email
+        recipients = ", ".join(p.email for p in booking_confirmation.passengers if p.email)
 
-        if emails:
-            logger.info(f"📧 [SIMULATED] Email sent to: {', '.join(emails)}")
-            print(f"\n📧 Ticket sent to: {', '.join(emails)}")
+        if recipients:
+            logger.info(f"📧 [SIMULATED] Email sent to: {recipients}")
+            print(f"\n📧 Ticket sent to: {recipients}")
         else:
             logger.info("📧 [SIMULATED] Email would be sent (no email addresses in demo)")
 
@@ -188,17 +200,22 @@ if __name__ == "__main__":
     ╚══════════════════════════════════════════════════════════════════════╝
     """
 
-    mock_booking = {
-        "booking_reference": "ABC123XYZ",
-        "status": "CONFIRMED",
-        "passengers": [
+    mock_booking = BookingConfirmation(
+        booking_reference="ABC123XYZ",
+        status="CONFIRMED",
+        total_price=299.99,
+        currency="USD",
+        passengers=[
             {
                 "first_name": "John",
                 "last_name": "Doe",
-                "email": "john.doe@example.com"
+                "gender": "M",
+                "email": "john.doe@example.com",
+                "phone": "+91-1234567890",
+                "id_number": "1234-5678-9012"
             }
         ]
-    }
+    )
 
     mock_state = {
         "formatted_ticket": mock_ticket,
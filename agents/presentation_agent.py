@@ -11,15 +11,145 @@ This agent:
 """
 
 from typing import Dict, Any, List
+from functools import lru_cache
+from operator import attrgetter
+import math
 import re
-from api.openai_client import OpenAIClient
+import sys
+from api.openai_client import get_openai_client
 from models.flight_models import FlightSearchResponse, FlightOffer, AlternativeDateOffer
+from utils.exceptions import BookingCancelled
 from utils.logger import setup_logger
 from tools.currency_converter_tool import convert_currency, get_currency_symbol, format_price
 from config import settings
 
 logger = setup_logger(__name__)
 
+# Durations are formatted as "Xh Ym" by the Amadeus client
+_DURATION_RE = re.compile(r'(?:(\d+)h)?\s*(?:(\d+)m)?')
+
+
+def _hhmm(timestamp: str) -> str:
+    """
+    Extract HH:MM from an ISO datetime string (YYYY-MM-DDTHH:MM:SS).
+
+    Strings without a 'T' separator are returned unchanged.
+    """
+    if len(timestamp) >= 16 and timestamp[10] == 'T':
+        return timestamp[11:16]
+    index = timestamp.find('T')
+    return timestamp[index + 1:index + 6] if index != -1 else timestamp
+
+
+def _keyword_pattern(*keywords: str) -> "re.Pattern[str]":
+    """Compile keywords into one case-insensitive substring alternation."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+
+# Sorting preferences checked in priority order: (type, keyword pattern, description)
+_SORT_PREFERENCES = [
+    # Price-related keywords
+    ('price_low', _keyword_pattern('cheapest', 'cheap', 'lowest price', 'budget', 'affordable', 'inexpensive'),
+     '💰 Cheapest flights first'),
+    ('price_high', _keyword_pattern('expensive', 'premium', 'luxury', 'first class', 'business class'),
+     '💰 Premium flights first'),
+    # Time-related keywords
+    ('time_early', _keyword_pattern('early morning', 'early', 'first flight', 'morning'),
+     '🌅 Early departure times first'),
+    ('time_late', _keyword_pattern('late', 'evening', 'night', 'after', 'pm'),
+     '🌙 Later departure times first'),
+    # Duration-related keywords
+    ('duration_short', _keyword_pattern('fastest', 'quickest', 'shortest', 'quick', 'fast'),
+     '⚡ Shortest flights first'),
+    # Direct flight keywords
+    ('direct', _keyword_pattern('direct', 'non-stop', 'nonstop', 'no stops', 'no connections'),
+     '✈️ Direct flights first'),
+    # Airline-specific keywords (if user mentions specific airline)
+    ('airline', _keyword_pattern('american', 'delta', 'united', 'lufthansa', 'emirates', 'qatar', 'singapore', 'british airways'),
+     '🏢 Sorted by airline name'),
+]
+
+# Borders for the detail / confirmation / presentation views
+_DETAIL_RULE = "=" * 60
+_RULE = "=" * 70
+_DOUBLE_RULE = "═" * 70
+_BAR_130 = "─" * 130
+_BAR_110 = "─" * 110
+
+# Inputs that abort the flight selection prompt
+_CANCEL_WORDS = frozenset({'cancel', 'exit', 'quit', 'q'})
+
+# C-level sort keys for flight offers
+_BY_PRICE = attrgetter("price")
+_BY_STOPS = attrgetter("number_of_stops")
+
+# Row templates for the flight tables (width specs parsed once, reused per row)
+_ROW_TMPL = "│ {:<3} │ {:<22} │ {:<18} │ {:<18} │ {:<10} │ {:<10} │ {:<8} │ {:<15} │ {:<6} │"
+_ALT_ROW_TMPL = "│ {:<12} │ {:<10} │ {:<12} │ {:<20} │ {:<10} │ {:<10} │ {:<15} │"
+
+@lru_cache(maxsize=256)
+def _match_sort_preference(prompt: str) -> tuple[str, str]:
+    """
+    Match a prompt against the sort keyword patterns (memoized per prompt).
+
+    Args:
+        prompt: Lowercased user prompt
+
+    Returns:
+        Tuple of (preference type, description)
+    """
+    # One C-level scan per category, stopping at the first match
+    for preference_type, pattern, description in _SORT_PREFERENCES:
+        if pattern.search(prompt):
+            return preference_type, description
+
+    # Default to cheapest
+    return 'price_low', '💰 Cheapest flights first (default)'
+
+
+# Static table chrome and help text for the flight presentation
+_TABLE_TOP = "┌" + _BAR_130 + "┐"
+_TABLE_HEADER = _ROW_TMPL.format(
+    '#', 'Carrier', 'Departure', 'Arrival', 'Duration', 'Stops', 'Class', 'Price', 'Seats'
+)
+_TABLE_SEP = "├" + _BAR_130 + "┤"
+_TABLE_BOTTOM = "└" + _BAR_130 + "┘"
+
+_ALT_TABLE_INTRO = "\n".join([
+    "\n",
+    "💰 CHEAPER ALTERNATIVES ON NEARBY DATES",
+    "   (Consider these dates to save money!)",
+    "\n┌" + _BAR_110 + "┐",
+    _ALT_ROW_TMPL.format('Date', 'Day', 'Savings', 'Carrier', 'Duration', 'Stops', 'Price'),
+    "├" + _BAR_110 + "┤",
+])
+_ALT_TABLE_OUTRO = "\n".join([
+    "└" + _BAR_110 + "┘",
+    "\n💡 Tip: Alternative dates show flights that are cheaper than your requested date.",
+    "   You can book these by running the search again with the new date.",
+])
+
+_SELECTION_FOOTER = "\n".join([
+    "\n" + _DOUBLE_RULE,
+    "📝 FLIGHT SELECTION",
+    _DOUBLE_RULE,
+    "Please select a flight option by entering the number (#)",
+    "",
+    "📋 Available Commands:",
+    "   • Enter number (1-N) = Select flight",
+    "   • 'info X' = Get detailed info about option X",
+    "   • 'cancel' = Exit program",
+    "",
+    "🔍 Flight Details Legend:",
+    "   • ✈️ Direct = Non-stop flight",
+    "   • 🔄 X stops = Flight with X connections",
+    "   • Seats = Available seats remaining",
+    "   • Times shown in 24-hour format (HH:MM)",
+    "",
+    "💡 Tip: Next time, mention preferences in your request:",
+    "   'Find cheapest flights...' | 'Direct flights only...' | 'Early morning flights...'",
+])
+
 
 class FlightPresentationAgent:
     """
@@ -31,7 +161,7 @@ class FlightPresentationAgent:
 
     def __init__(self):
         """Initialize the agent with OpenAI client."""
-        self.openai_client = OpenAIClient()
+        self.openai_client = get_openai_client()
 
     def execute(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -46,20 +176,24 @@ class FlightPresentationAgent:
         logger.info("Flight Presentation Agent executing")
 
         try:
-            # Extract flight results from state
-            flight_results = FlightSearchResponse.model_validate(state["flight_results"])
+            # Extract flight results from state (validated once here)
+            flight_results = state["flight_results"]
+            if not isinstance(flight_results, FlightSearchResponse):
+                flight_results = FlightSearchResponse.model_validate(flight_results)
             parsed_request = state["parsed_request"]
 
             # Convert currencies if enabled
             if settings.enable_currency_conversion:
                 flight_results = self._convert_currencies(flight_results)
-                # Update state with converted prices
-                state["flight_results"] = flight_results.model_dump()
 
             # Auto-detect sorting preference from user message and sort flights
             sorted_offers = self._sort_flights_by_preference(flight_results.original_date_offers, state.get("user_prompt", ""))
             flight_results.original_date_offers = sorted_offers
 
+            # Keep the converted, sorted model in state so selection numbers
+            # match the displayed table and need no re-validation
+            state["flight_results"] = flight_results
+
             # Format flights for presentation
             presentation = self._format_flight_presentation(
                 flight_results,
@@ -70,9 +204,7 @@ class FlightPresentationAgent:
             state["presentation"] = presentation
 
             # Display to user
-            print("\n" + "="*70)
-            print(presentation)
-            print("="*70)
+            sys.stdout.write(f"\n{_RULE}\n{presentation}\n{_RULE}\n")
 
             logger.info("Flight presentation displayed to user")
 
@@ -119,31 +251,31 @@ class FlightPresentationAgent:
 
         # Main flights table
         if flight_results.original_date_offers:
-            output.append("┌" + "─" * 130 + "┐")
-            output.append(f"│ {'#':<3} │ {'Carrier':<22} │ {'Departure':<18} │ {'Arrival':<18} │ {'Duration':<10} │ {'Stops':<10} │ {'Class':<8} │ {'Price':<15} │ {'Seats':<6} │")
-            output.append("├" + "─" * 130 + "┤")
+            output.append(_TABLE_TOP)
+            output.append(_TABLE_HEADER)
+            output.append(_TABLE_SEP)
 
             for i, offer in enumerate(flight_results.original_date_offers, start=1):
-                first_segment = offer.segments[0]
-                last_segment = offer.segments[-1]
+                segments = offer.segments
+                first_segment = segments[0]
+                last_segment = segments[-1]
 
                 # Extract time from datetime string (YYYY-MM-DDTHH:MM:SS)
-                dept_time = first_segment.departure_time.split('T')[1][:5] if 'T' in first_segment.departure_time else first_segment.departure_time
-                arr_time = last_segment.arrival_time.split('T')[1][:5] if 'T' in last_segment.arrival_time else last_segment.arrival_time
+                dept_time = _hhmm(first_segment.departure_time)
+                arr_time = _hhmm(last_segment.arrival_time)
 
                 # Format carrier with code and name
-                carrier_code = first_segment.carrier_code
-                carrier_name = first_segment.carrier_name
-                carrier = f"{carrier_code} - {carrier_name}"[:22]  # Truncate if too long
+                carrier = f"{first_segment.carrier_code} - {first_segment.carrier_name}"[:22]  # Truncate if too long
                 departure = f"{dept_time} {first_segment.departure_airport}"
                 arrival = f"{arr_time} {last_segment.arrival_airport}"
-                
+
                 # Enhanced stops display
-                if offer.number_of_stops == 0:
+                stops = offer.number_of_stops
+                if stops == 0:
                     stops_text = "✈️ Direct"
                 else:
-                    stops_text = f"🔄 {offer.number_of_stops} stop{'s' if offer.number_of_stops > 1 else ''}"
-                
+                    stops_text = f"🔄 {stops} stop{'s' if stops > 1 else ''}"
+
                 # Format class
                 class_short = offer.booking_class[:8] if offer.booking_class else "ECONOMY"
 
@@ -153,70 +285,52 @@ class FlightPresentationAgent:
                 # Available seats
                 seats = str(offer.available_seats) if offer.available_seats else "N/A"
 
-                output.append(f"│ {i:<3} │ {carrier:<22} │ {departure:<18} │ {arrival:<18} │ {offer.total_duration:<10} │ {stops_text:<10} │ {class_short:<8} │ {price:<15} │ {seats:<6} │")
+                output.append(_ROW_TMPL.format(
+                    i, carrier, departure, arrival, offer.total_duration,
+                    stops_text, class_short, price, seats
+                ))
 
-            output.append("└" + "─" * 130 + "┘")
+            output.append(_TABLE_BOTTOM)
         else:
             output.append("❌ No flights found for the requested date.")
 
         # Alternative dates table
         if flight_results.alternative_offers:
-            output.append("\n")
-            output.append("💰 CHEAPER ALTERNATIVES ON NEARBY DATES")
-            output.append("   (Consider these dates to save money!)")
-            output.append("\n┌" + "─" * 110 + "┐")
-            output.append(f"│ {'Date':<12} │ {'Day':<10} │ {'Savings':<12} │ {'Carrier':<20} │ {'Duration':<10} │ {'Stops':<10} │ {'Price':<15} │")
-            output.append("├" + "─" * 110 + "┤")
+            output.append(_ALT_TABLE_INTRO)
 
             for alt in flight_results.alternative_offers:
-                cheapest = min(alt.offers, key=lambda x: x.price)
-                
+                cheapest = alt.cheapest_offer
+
                 # Format date and day
                 date_str = str(alt.departure_date)
                 day_name = alt.departure_date.strftime("%A")[:9]  # Truncate long day names
-                
+
                 # Format savings with currency symbol
                 savings = f"💰 -{abs(alt.price_difference):.2f}"
-                
+
                 # Format carrier with code and name
                 first_seg = cheapest.segments[0]
                 carrier = f"{first_seg.carrier_code} - {first_seg.carrier_name}"[:20]
-                
+
                 # Enhanced stops display
-                if cheapest.number_of_stops == 0:
+                stops = cheapest.number_of_stops
+                if stops == 0:
                     stops_text = "✈️ Direct"
                 else:
-                    stops_text = f"🔄 {cheapest.number_of_stops} stop{'s' if cheapest.number_of_stops > 1 else ''}"
+                    stops_text = f"🔄 {stops} stop{'s' if stops > 1 else ''}"
 
                 price = f"{cheapest.currency} {cheapest.price:.2f}*"
 
-                output.append(f"│ {date_str:<12} │ {day_name:<10} │ {savings:<12} │ {carrier:<20} │ {cheapest.total_duration:<10} │ {stops_text:<10} │ {price:<15} │")
+                output.append(_ALT_ROW_TMPL.format(
+                    date_str, day_name, savings, carrier, cheapest.total_duration,
+                    stops_text, price
+                ))
 
-            output.append("└" + "─" * 110 + "┘")
-            
-            # Add note about alternative dates
-            output.append("\n💡 Tip: Alternative dates show flights that are cheaper than your requested date.")
-            output.append("   You can book these by running the search again with the new date.")
+            # Closing border plus a note about alternative dates
+            output.append(_ALT_TABLE_OUTRO)
 
         # Selection prompt with helpful instructions
-        output.append("\n" + "═" * 70)
-        output.append("📝 FLIGHT SELECTION")
-        output.append("═" * 70)
-        output.append("Please select a flight option by entering the number (#)")
-        output.append("")
-        output.append("� Available Commands:")
-        output.append("   • Enter number (1-N) = Select flight")
-        output.append("   • 'info X' = Get detailed info about option X")
-        output.append("   • 'cancel' = Exit program")
-        output.append("")
-        output.append("�🔍 Flight Details Legend:")
-        output.append("   • ✈️ Direct = Non-stop flight")
-        output.append("   • 🔄 X stops = Flight with X connections")
-        output.append("   • Seats = Available seats remaining")
-        output.append("   • Times shown in 24-hour format (HH:MM)")
-        output.append("")
-        output.append("💡 Tip: Next time, mention preferences in your request:")
-        output.append("   'Find cheapest flights...' | 'Direct flights only...' | 'Early morning flights...'")  
+        output.append(_SELECTION_FOOTER)
 
         return "\n".join(output)
 
@@ -269,9 +383,14 @@ class FlightPresentationAgent:
                 min_original_price = min(o.price for o in converted_offers)
                 new_price_diff = min_alt_price - min_original_price
                 
-                alt.offers = converted_alt_offers
-                alt.price_difference = new_price_diff
-                converted_alternatives.append(alt)
+                # Build a fresh object so no cached cheapest offer goes stale
+                converted_alternatives.append(
+                    AlternativeDateOffer(
+                        departure_date=alt.departure_date,
+                        offers=converted_alt_offers,
+                        price_difference=new_price_diff
+                    )
+                )
         
         flight_results.alternative_offers = converted_alternatives
         
@@ -279,67 +398,6 @@ class FlightPresentationAgent:
         
         return flight_results
 
-    def _format_offers_list(self, offers: List[FlightOffer]) -> List[Dict[str, Any]]:
-        """
-        Convert flight offers to simple dict format for LLM.
-
-        Args:
-            offers: List of flight offers
-
-        Returns:
-            List of simplified offer dictionaries
-        """
-        formatted = []
-
-        for i, offer in enumerate(offers, start=1):
-            # Get first and last segment for departure/arrival
-            first_segment = offer.segments[0]
-            last_segment = offer.segments[-1]
-
-            formatted.append({
-                "option_number": i,
-                "offer_id": offer.id,
-                "carrier": offer.get_carrier_names(),
-                "departure": f"{first_segment.departure_time} from {first_segment.departure_airport}",
-                "arrival": f"{last_segment.arrival_time} at {last_segment.arrival_airport}",
-                "duration": offer.total_duration,
-                "stops": offer.number_of_stops,
-                "price": f"{offer.price} {offer.currency}",
-                "class": offer.booking_class
-            })
-
-        return formatted
-
-    def _format_alternatives_list(
-        self,
-        alternatives: List[AlternativeDateOffer]
-    ) -> List[Dict[str, Any]]:
-        """
-        Format alternative date offers for LLM.
-
-        Args:
-            alternatives: List of alternative date offers
-
-        Returns:
-            List of simplified alternative dictionaries
-        """
-        formatted = []
-
-        for alt in alternatives:
-            # Get cheapest flight for this date
-            cheapest = min(alt.offers, key=lambda x: x.price)
-
-            formatted.append({
-                "date": str(alt.departure_date),
-                "savings": f"{abs(alt.price_difference):.2f}",
-                "cheapest_price": f"{cheapest.price} {cheapest.currency}",
-                "carrier": cheapest.get_carrier_names(),
-                "duration": cheapest.total_duration,
-                "stops": cheapest.number_of_stops
-            })
-
-        return formatted
-
     def _sort_flights_by_preference(self, offers: List[FlightOffer], user_prompt: str = "") -> List[FlightOffer]:
         """
         Automatically detect sorting preference from user message and sort flights accordingly.
@@ -355,6 +413,10 @@ class FlightPresentationAgent:
         if not offers:
             return offers
 
+        # No prompt to analyze: skip keyword detection and use the default
+        if not user_prompt or not user_prompt.strip():
+            return sorted(offers, key=_BY_PRICE)
+
         # Detect sorting preference from user's message
         sort_preference = self._detect_sorting_preference(user_prompt)
         
@@ -363,16 +425,16 @@ class FlightPresentationAgent:
         
         # Sort based on detected preference
         if sort_preference['type'] == 'price_low':
-            return sorted(offers, key=lambda x: x.price)
+            return sorted(offers, key=_BY_PRICE)
         
         elif sort_preference['type'] == 'price_high':
-            return sorted(offers, key=lambda x: x.price, reverse=True)
+            return sorted(offers, key=_BY_PRICE, reverse=True)
         
         elif sort_preference['type'] == 'time_early':
-            return sorted(offers, key=lambda x: self._extract_departure_time(x))
+            return sorted(offers, key=self._extract_departure_minute)
         
         elif sort_preference['type'] == 'time_late':
-            return sorted(offers, key=lambda x: self._extract_departure_time(x), reverse=True)
+            return sorted(offers, key=self._extract_departure_minute, reverse=True)
         
         elif sort_preference['type'] == 'duration_short':
             return sorted(offers, key=lambda x: self._parse_duration_minutes(x.total_duration))
@@ -381,7 +443,8 @@ class FlightPresentationAgent:
             return sorted(offers, key=lambda x: self._parse_duration_minutes(x.total_duration), reverse=True)
         
         elif sort_preference['type'] == 'direct':
-            return sorted(offers, key=lambda x: (x.number_of_stops, x.price))
+            # Stable sort: price order is kept within each stop count
+            return sorted(sorted(offers, key=_BY_PRICE), key=_BY_STOPS)
         
         elif sort_preference['type'] == 'airline':
             return sorted(offers, key=lambda x: x.get_carrier_names().lower())
@@ -390,7 +453,7 @@ class FlightPresentationAgent:
             return self._sort_by_overall_score(offers)
         
         # Default: cheapest first
-        return sorted(offers, key=lambda x: x.price)
+        return sorted(offers, key=_BY_PRICE)
 
     def _detect_sorting_preference(self, user_prompt: str) -> Dict[str, str]:
         """
@@ -402,55 +465,27 @@ class FlightPresentationAgent:
         Returns:
             Dictionary with preference type and description
         """
-        prompt_lower = user_prompt.lower()
-        
-        # Price-related keywords
-        if any(keyword in prompt_lower for keyword in ['cheapest', 'cheap', 'lowest price', 'budget', 'affordable', 'inexpensive']):
-            return {'type': 'price_low', 'description': '💰 Cheapest flights first'}
-        
-        if any(keyword in prompt_lower for keyword in ['expensive', 'premium', 'luxury', 'first class', 'business class']):
-            return {'type': 'price_high', 'description': '💰 Premium flights first'}
-        
-        # Time-related keywords
-        if any(keyword in prompt_lower for keyword in ['early morning', 'early', 'first flight', 'morning']):
-            return {'type': 'time_early', 'description': '🌅 Early departure times first'}
-        
-        if any(keyword in prompt_lower for keyword in ['late', 'evening', 'night', 'after', 'pm']):
-            return {'type': 'time_late', 'description': '🌙 Later departure times first'}
-        
-        # Duration-related keywords
-        if any(keyword in prompt_lower for keyword in ['fastest', 'quickest', 'shortest', 'quick', 'fast']):
-            return {'type': 'duration_short', 'description': '⚡ Shortest flights first'}
-        
-        # Direct flight keywords
-        if any(keyword in prompt_lower for keyword in ['direct', 'non-stop', 'nonstop', 'no stops', 'no connections']):
-            return {'type': 'direct', 'description': '✈️ Direct flights first'}
-        
-        # Airline-specific keywords (if user mentions specific airline)
-        airlines = ['american', 'delta', 'united', 'lufthansa', 'emirates', 'qatar', 'singapore', 'british airways']
-        if any(airline in prompt_lower for airline in airlines):
-            return {'type': 'airline', 'description': '🏢 Sorted by airline name'}
-        
-        # Default to cheapest
-        return {'type': 'price_low', 'description': '💰 Cheapest flights first (default)'}
+        preference_type, description = _match_sort_preference(user_prompt.lower())
+        return {'type': preference_type, 'description': description}
 
-    def _extract_departure_time(self, offer: FlightOffer) -> str:
+    def _extract_departure_minute(self, offer: FlightOffer) -> int:
         """
-        Extract departure time from first segment for sorting.
+        Extract departure time from first segment as minutes after midnight for sorting.
 
         Args:
             offer: Flight offer
 
         Returns:
-            Departure time string for comparison
+            Departure minute of day (0 if missing or not HH:MM)
         """
         if offer.segments:
             # Extract time from datetime string (YYYY-MM-DDTHH:MM:SS)
-            dept_time = offer.segments[0].departure_time
-            if 'T' in dept_time:
-                return dept_time.split('T')[1][:5]  # HH:MM
-            return dept_time
-        return "00:00"
+            hhmm = _hhmm(offer.segments[0].departure_time)
+            try:
+                return int(hhmm[:2]) * 60 + int(hhmm[3:5])
+            except ValueError:
+                pass
+        return 0
 
     def _parse_duration_minutes(self, duration_str: str) -> int:
         """
@@ -462,14 +497,10 @@ class FlightPresentationAgent:
         Returns:
             Total minutes as integer
         """
-        # Extract hours and minutes using regex
-        hours_match = re.search(r'(\d+)h', duration_str)
-        minutes_match = re.search(r'(\d+)m', duration_str)
-        
-        hours = int(hours_match.group(1)) if hours_match else 0
-        minutes = int(minutes_match.group(1)) if minutes_match else 0
-        
-        return hours * 60 + minutes
+        # Extract hours and minutes with a single precompiled regex
+        hours, minutes = _DURATION_RE.match(duration_str).groups()
+
+        return int(hours or 0) * 60 + int(minutes or 0)
 
     def _sort_by_overall_score(self, offers: List[FlightOffer]) -> List[FlightOffer]:
         """
@@ -486,32 +517,43 @@ class FlightPresentationAgent:
         if not offers:
             return offers
 
-        # Calculate min/max values for normalization
-        prices = [offer.price for offer in offers]
-        durations = [self._parse_duration_minutes(offer.total_duration) for offer in offers]
-        
-        min_price, max_price = min(prices), max(prices)
-        min_duration, max_duration = min(durations), max(durations)
-        
-        def calculate_score(offer: FlightOffer) -> float:
-            # Normalize price (0-100)
-            price_score = 0 if max_price == min_price else ((offer.price - min_price) / (max_price - min_price)) * 100
-            
-            # Normalize duration (0-100)
+        # Single pass: parse each duration once and track min/max for normalization
+        parsed = []
+        min_price = min_duration = math.inf
+        max_price = max_duration = -math.inf
+        for offer in offers:
+            price = offer.price
             duration = self._parse_duration_minutes(offer.total_duration)
-            duration_score = 0 if max_duration == min_duration else ((duration - min_duration) / (max_duration - min_duration)) * 100
-            
-            # Stops penalty (0, 25, 50, 75, 100 for 0, 1, 2, 3, 4+ stops)
-            stops_score = min(offer.number_of_stops * 25, 100)
-            
-            # Weighted total score (lower is better)
-            # Price: 50%, Duration: 30%, Stops: 20%
-            total_score = (price_score * 0.5) + (duration_score * 0.3) + (stops_score * 0.2)
-            
-            return total_score
+            if price < min_price:
+                min_price = price
+            if price > max_price:
+                max_price = price
+            if duration < min_duration:
+                min_duration = duration
+            if duration > max_duration:
+                max_duration = duration
+            parsed.append((price, duration, offer))
+
+        # Ranges of 0 collapse to 1 so identical values normalize to 0
+        price_range = (max_price - min_price) or 1
+        duration_range = (max_duration - min_duration) or 1
+
+        # Weighted total score (lower is better)
+        # Price: 50%, Duration: 30%, Stops: 20% (stops penalty 25 per stop, capped at 100)
+        scored = [
+            (
+                ((price - min_price) / price_range) * 50
+                + ((duration - min_duration) / duration_range) * 30
+                + min(offer.number_of_stops * 25, 100) * 0.2,
+                offer
+            )
+            for price, duration, offer in parsed
+        ]
+
+        # Sort by score (ascending - lower is better), stable for ties
+        scored.sort(key=lambda item: item[0])
 
-        # Sort by score (ascending - lower is better)
-        return sorted(offers, key=calculate_score)
+        return [offer for _, offer in scored]
 
     def get_user_selection(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -523,72 +565,76 @@ class FlightPresentationAgent:
         Returns:
             Updated state with selected flight
         """
-        flight_results = FlightSearchResponse.model_validate(state["flight_results"])
+        flight_results = state["flight_results"]
+        if not isinstance(flight_results, FlightSearchResponse):
+            flight_results = FlightSearchResponse.model_validate(flight_results)
         total_options = len(flight_results.original_date_offers)
 
         if total_options == 0:
             raise ValueError("No flights available for selection")
 
+        offers = flight_results.original_date_offers
+        prompt = f"👆 Enter your choice (1-{total_options}), 'info X' for details, or 'cancel' to exit: "
+
         while True:
-            try:
-                print("\n")
-                selection = input(f"👆 Enter your choice (1-{total_options}), 'info X' for details, or 'cancel' to exit: ").strip().lower()
-
-                # Handle cancel/exit request
-                if selection in ['cancel', 'exit', 'quit', 'q']:
-                    print("\n🚪 Booking cancelled by user. Thank you for using AI Ticket Booking!")
-                    raise KeyboardInterrupt("User cancelled the booking process")
-
-                # Handle info request (e.g., "info 2" to get details about option 2)
-                if selection.startswith('info '):
-                    try:
-                        info_num = int(selection.split()[1])
-                        if 1 <= info_num <= total_options:
-                            self._show_flight_details(flight_results.original_date_offers[info_num - 1], info_num)
-                            continue
-                        else:
-                            print(f"❌ Please use 'info X' where X is between 1 and {total_options}")
-                            continue
-                    except (IndexError, ValueError):
-                        print("❌ Invalid format. Use 'info 2' to get details about option 2")
-                        continue
-
-                # Handle normal selection
-                option_num = int(selection)
-
-                if 1 <= option_num <= total_options:
-                    # Valid selection
-                    selected_offer = flight_results.original_date_offers[option_num - 1]
-                    state["selected_offer"] = selected_offer.model_dump()
-                    state["selection_number"] = option_num
-
-                    logger.info(f"User selected option {option_num}: {selected_offer.id}")
-
-                    # Show selection confirmation with details
-                    self._show_selection_confirmation(selected_offer, option_num)
-                    
-                    # Ask for final confirmation
-                    confirm = input("\n🤔 Confirm this selection? (y/n/cancel) [y]: ").strip().lower()
-                    if confirm in ['', 'y', 'yes']:
-                        break
-                    elif confirm in ['cancel', 'exit', 'quit']:
-                        print("\n🚪 Booking cancelled by user. Thank you for using AI Ticket Booking!")
-                        raise KeyboardInterrupt("User cancelled the booking process")
+            print("\n")
+            # Tokenize once and dispatch on the first word
+            tokens = input(prompt).strip().lower().split()
+            command = tokens[0] if tokens else ""
+
+            # Handle cancel/exit request
+            if command in _CANCEL_WORDS and len(tokens) == 1:
+                print("\n🚪 Booking cancelled by user. Thank you for using AI Ticket Booking!")
+                raise BookingCancelled("User cancelled the booking process")
+
+            # Handle info request (e.g., "info 2" to get details about option 2)
+            if command == 'info' and len(tokens) > 1:
+                if len(tokens) == 2 and tokens[1].isdecimal():
+                    info_num = int(tokens[1])
+                    if 1 <= info_num <= total_options:
+                        self._show_flight_details(offers[info_num - 1], info_num)
                     else:
-                        print("Selection cancelled. Please choose again.")
-                        continue
-
+                        print(f"❌ Please use 'info X' where X is between 1 and {total_options}")
                 else:
-                    print(f"❌ Please select a number between 1 and {total_options}")
-                    continue
+                    print("❌ Invalid format. Use 'info 2' to get details about option 2")
+                continue
 
-            except ValueError:
-                print(f"❌ Invalid input. Please enter:")
-                print(f"   • A number between 1 and {total_options} (to select flight)")
-                print(f"   • 'info X' (for details about option X)")
-                print(f"   • 'cancel' (to exit program)")
+            if len(tokens) != 1 or not command.isdecimal():
+                print(
+                    f"❌ Invalid input. Please enter:\n"
+                    f"   • A number between 1 and {total_options} (to select flight)\n"
+                    f"   • 'info X' (for details about option X)\n"
+                    f"   • 'cancel' (to exit program)"
+                )
                 continue
 
+            # Handle normal selection
+            option_num = int(command)
+
+            if not 1 <= option_num <= total_options:
+                print(f"❌ Please select a number between 1 and {total_options}")
+                continue
+
+            # Valid selection
+            selected_offer = offers[option_num - 1]
+            state["selected_offer"] = selected_offer
+            state["selection_number"] = option_num
+
+            logger.info(f"User selected option {option_num}: {selected_offer.id}")
+
+            # Show selection confirmation with details
+            self._show_selection_confirmation(selected_offer, option_num)
+
+            # Ask for final confirmation
+            confirm = input("\n🤔 Confirm this selection? (y/n/cancel) [y]: ").strip().lower()
+            if confirm in ['', 'y', 'yes']:
+                break
+            elif confirm in ['cancel', 'exit', 'quit']:
+                print("\n🚪 Booking cancelled by user. Thank you for using AI Ticket Booking!")
+                raise BookingCancelled("User cancelled the booking process")
+            else:
+                print("Selection cancelled. Please choose again.")
+
         return state
 
     def _show_flight_details(self, offer: FlightOffer, option_num: int) -> None:
@@ -599,29 +645,32 @@ class FlightPresentationAgent:
             offer: Flight offer to show details for
             option_num: Option number for display
         """
-        print(f"\n{'='*60}")
-        print(f"✈️  DETAILED INFO - OPTION {option_num}")
-        print(f"{'='*60}")
-
-        print(f"🏢 Carrier: {offer.get_carrier_names()}")
-        print(f"💰 Base Fare: {offer.currency} {offer.price:.2f}*")
-        print(f"   * {settings.gst_rate}% GST will be added at checkout")
-        print(f"🎫 Class: {offer.booking_class}")
-        print(f"⏱️  Total Duration: {offer.total_duration}")
-        print(f"🔄 Stops: {offer.number_of_stops}")
-        print(f"💺 Available Seats: {offer.available_seats or 'N/A'}")
-        
-        print(f"\n🛫 Flight Segments:")
+        lines = [
+            f"\n{_DETAIL_RULE}",
+            f"✈️  DETAILED INFO - OPTION {option_num}",
+            _DETAIL_RULE,
+            f"🏢 Carrier: {offer.get_carrier_names()}",
+            f"💰 Base Fare: {offer.currency} {offer.price:.2f}*",
+            f"   * {settings.gst_rate}% GST will be added at checkout",
+            f"🎫 Class: {offer.booking_class}",
+            f"⏱️  Total Duration: {offer.total_duration}",
+            f"🔄 Stops: {offer.number_of_stops}",
+            f"💺 Available Seats: {offer.available_seats or 'N/A'}",
+            "\n🛫 Flight Segments:",
+        ]
         for i, segment in enumerate(offer.segments, 1):
-            dept_time = segment.departure_time.split('T')[1][:5] if 'T' in segment.departure_time else segment.departure_time
-            arr_time = segment.arrival_time.split('T')[1][:5] if 'T' in segment.arrival_time else segment.arrival_time
-            
-            print(f"   Segment {i}: {segment.carrier_name} {segment.flight_number}")
-            print(f"   {segment.departure_airport} ({dept_time}) → {segment.arrival_airport} ({arr_time})")
-            print(f"   Duration: {segment.duration}")
+            dept_time = _hhmm(segment.departure_time)
+            arr_time = _hhmm(segment.arrival_time)
+
+            lines.append(f"   Segment {i}: {segment.carrier_name} {segment.flight_number}")
+            lines.append(f"   {segment.departure_airport} ({dept_time}) → {segment.arrival_airport} ({arr_time})")
+            lines.append(f"   Duration: {segment.duration}")
             if segment.aircraft:
-                print(f"   Aircraft: {segment.aircraft}")
-            print()
+                lines.append(f"   Aircraft: {segment.aircraft}")
+            lines.append("")
+
+        # One write for the whole block instead of a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _show_selection_confirmation(self, offer: FlightOffer, option_num: int) -> None:
         """
@@ -631,26 +680,30 @@ class FlightPresentationAgent:
             offer: Selected flight offer
             option_num: Option number selected
         """
-        print(f"\n{'='*70}")
-        print(f"✅ SELECTION CONFIRMATION - OPTION {option_num}")
-        print(f"{'='*70}")
-        
         first_segment = offer.segments[0]
         last_segment = offer.segments[-1]
-        
-        dept_time = first_segment.departure_time.split('T')[1][:5] if 'T' in first_segment.departure_time else first_segment.departure_time
-        arr_time = last_segment.arrival_time.split('T')[1][:5] if 'T' in last_segment.arrival_time else last_segment.arrival_time
-        
-        print(f"🏢 Airline: {offer.get_carrier_names()}")
-        print(f"🛫 Route: {first_segment.departure_airport} → {last_segment.arrival_airport}")
-        print(f"📅 Departure: {dept_time}")
-        print(f"📅 Arrival: {arr_time}")
-        print(f"⏱️  Duration: {offer.total_duration}")
-        print(f"🔄 Stops: {'Direct flight' if offer.number_of_stops == 0 else f'{offer.number_of_stops} stop(s)'}")
-        print(f"🎫 Class: {offer.booking_class}")
-        print(f"💰 Base Fare: {offer.currency} {offer.price:.2f}*")
-        print(f"   * {settings.gst_rate}% GST will be added at checkout")
-        print(f"{'='*70}")
+
+        dept_time = _hhmm(first_segment.departure_time)
+        arr_time = _hhmm(last_segment.arrival_time)
+
+        lines = [
+            f"\n{_RULE}",
+            f"✅ SELECTION CONFIRMATION - OPTION {option_num}",
+            _RULE,
+            f"🏢 Airline: {offer.get_carrier_names()}",
+            f"🛫 Route: {first_segment.departure_airport} → {last_segment.arrival_airport}",
+            f"📅 Departure: {dept_time}",
+            f"📅 Arrival: {arr_time}",
+            f"⏱️  Duration: {offer.total_duration}",
+            f"🔄 Stops: {'Direct flight' if offer.number_of_stops == 0 else f'{offer.number_of_stops} stop(s)'}",
+            f"🎫 Class: {offer.booking_class}",
+            f"💰 Base Fare: {offer.currency} {offer.price:.2f}*",
+            f"   * {settings.gst_rate}% GST will be added at checkout",
+            _RULE,
+        ]
+
+        # One write for the whole block instead of a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 # Example usage for testing
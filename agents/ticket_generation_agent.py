@@ -3,21 +3,80 @@ Agent 4: Ticket Generation Agent
 
 This agent:
 1. Receives booking confirmation from Agent 3
-2. Uses LLM to generate professional ticket document
+2. Renders a professional ticket document (template, or LLM if enabled)
 3. Formats flight details, passenger info, and booking reference
 4. Creates a ticket-style presentation
 5. Passes formatted ticket to final notification agent
 """
 
 from typing import Dict, Any
-from api.openai_client import OpenAIClient
-from models.flight_models import BookingConfirmation, FlightOffer, PassengerInfo
+import json
+from openai import OpenAIError
+from pydantic import ValidationError
+from api.openai_client import get_openai_client
+from models.flight_models import BookingConfirmation
 from utils.logger import setup_logger
 from tools.currency_converter_tool import convert_currency, get_currency_symbol
 from config import settings
 
 logger = setup_logger(__name__)
 
+# Output cap for LLM ticket rendering (a full ticket is well under this)
+TICKET_MAX_TOKENS = 1000
+
+# System prompt for LLM ticket rendering (kept byte-identical across calls)
+_TICKET_SYSTEM_PROMPT = """You are a professional ticket generation system. Create a beautifully formatted airline ticket.
+
+Your ticket should include:
+
+1. **HEADER**: "✈️ E-TICKET / BOARDING PASS"
+2. **Booking Reference**: Large, prominent PNR
+3. **Booking Status**: Confirmed/Pending
+4. **Passenger Information**:
+   - Name(s)
+   - Government ID Type and Number
+   - Email
+   - Phone
+5. **Flight Details**:
+   - Carrier name and flight number(s)
+   - Route (Origin → Destination with full airport names)
+   - Departure date and time
+   - Arrival date and time
+   - Duration
+   - Number of stops
+   - Booking class
+6. **Price Breakdown** (IMPORTANT - Show all three lines):
+   - Base Fare: [amount]
+   - GST ([rate]): [amount]
+   - Total Amount: [amount] (in bold or highlighted)
+   - Booking date
+7. **Important Information Section**:
+   - Check-in opens 24 hours before departure
+   - Arrive at airport 2-3 hours before international flights
+   - Valid ID required
+   - Baggage allowance info
+
+Format it to look like a real airline ticket with clear sections, borders made with characters like ═, ║, ─.
+Use emojis appropriately for visual appeal.
+
+Make it professional and easy to read. Use proper spacing and alignment.
+IMPORTANT: Always show the price breakdown with base fare, GST amount, and total separately."""
+
+# PassengerInfo fields copied verbatim onto the ticket
+_PASSENGER_TICKET_FIELDS = {"gender", "id_type", "id_number", "email", "phone"}
+
+# Borders and static text for the built-in ticket template
+_TICKET_RULE = "═" * 70
+_TICKET_DIVIDER = "─" * 70
+_TICKET_IMPORTANT_INFO = (
+    "ℹ️  IMPORTANT INFORMATION",
+    _TICKET_DIVIDER,
+    "  • Check-in opens 24 hours before departure",
+    "  • Arrive at the airport 2-3 hours before international flights",
+    "  • A valid government-issued photo ID is required at the airport",
+    "  • Baggage allowance is as per the airline's fare rules for your class",
+)
+
 
 class TicketGenerationAgent:
     """
@@ -29,7 +88,7 @@ class TicketGenerationAgent:
 
     def __init__(self):
         """Initialize the agent with OpenAI client."""
-        self.openai_client = OpenAIClient()
+        self.openai_client = get_openai_client()
 
     def execute(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -43,30 +102,43 @@ class TicketGenerationAgent:
         """
         logger.debug("Ticket Generation Agent executing")
 
+        # Extract booking confirmation from state
         try:
-            # Extract booking confirmation from state
-            booking_confirmation = BookingConfirmation.model_validate(
-                state["booking_confirmation"]
-            )
+            booking_confirmation = state["booking_confirmation"]
+            if not isinstance(booking_confirmation, BookingConfirmation):
+                booking_confirmation = BookingConfirmation.model_validate(booking_confirmation)
+            if booking_confirmation.flight_offer is None:
+                raise ValueError("Booking confirmation has no flight offer")
+        except (KeyError, ValidationError, ValueError) as e:
+            logger.exception(f"Ticket Generation Agent received no valid booking confirmation: {e}")
+            state["error"] = str(e)
+            raise
 
-            # Generate formatted ticket
+        # Generate formatted ticket
+        try:
             formatted_ticket = self._generate_ticket(booking_confirmation)
-
-            # Store in state
-            state["formatted_ticket"] = formatted_ticket
-
-            logger.debug("Ticket generated successfully")
-
-            return state
-
+        except OpenAIError as e:
+            logger.exception(f"OpenAI error in Ticket Generation Agent: {e}")
+            state["error"] = str(e)
+            raise
         except Exception as e:
-            logger.error(f"Error in Ticket Generation Agent: {e}")
+            logger.exception(f"Error in Ticket Generation Agent: {e}")
             state["error"] = str(e)
             raise
 
+        # Store in state
+        state["formatted_ticket"] = formatted_ticket
+
+        logger.debug("Ticket generated successfully")
+
+        return state
+
     def _generate_ticket(self, booking: BookingConfirmation) -> str:
         """
-        Generate a professional ticket document using LLM.
+        Generate a professional ticket document.
+
+        The ticket is rendered from a fixed template; the LLM is only used
+        when settings.use_llm_ticket_renderer is enabled.
 
         Args:
             booking: Booking confirmation with all details
@@ -77,51 +149,86 @@ class TicketGenerationAgent:
         # Prepare structured data for ticket generation
         ticket_data = self._prepare_ticket_data(booking)
 
-        # Use LLM to format the ticket
-        format_instruction = """You are a professional ticket generation system. Create a beautifully formatted airline ticket.
+        if not settings.use_llm_ticket_renderer:
+            return self._render_ticket(ticket_data)
 
-Your ticket should include:
+        # Use LLM to format the ticket: static system prompt first so it is
+        # served from the provider's prompt cache, only the data varies
+        formatted_ticket = self.openai_client.format_response(
+            data=json.dumps(ticket_data, ensure_ascii=False),
+            format_instruction=_TICKET_SYSTEM_PROMPT,
+            temperature=0.2,  # Formatting only: keep output close to deterministic
+            max_tokens=TICKET_MAX_TOKENS
+        )
 
-1. **HEADER**: "✈️ E-TICKET / BOARDING PASS"
-2. **Booking Reference**: Large, prominent PNR
-3. **Booking Status**: Confirmed/Pending
-4. **Passenger Information**:
-   - Name(s)
-   - Government ID Type and Number
-   - Email
-   - Phone
-5. **Flight Details**:
-   - Carrier name and flight number(s)
-   - Route (Origin → Destination with full airport names)
-   - Departure date and time
-   - Arrival date and time
-   - Duration
-   - Number of stops
-   - Booking class
-6. **Price Breakdown** (IMPORTANT - Show all three lines):
-   - Base Fare: [amount]
-   - GST ([rate]): [amount]
-   - Total Amount: [amount] (in bold or highlighted)
-   - Booking date
-7. **Important Information Section**:
-   - Check-in opens 24 hours before departure
-   - Arrive at airport 2-3 hours before international flights
-   - Valid ID required
-   - Baggage allowance info
+        return formatted_ticket
 
-Format it to look like a real airline ticket with clear sections, borders made with characters like ═, ║, ─.
-Use emojis appropriately for visual appeal.
+    def _render_ticket(self, ticket_data: Dict[str, Any]) -> str:
+        """
+        Render prepared ticket data into the e-ticket layout.
 
-Make it professional and easy to read. Use proper spacing and alignment.
-IMPORTANT: Always show the price breakdown with base fare, GST amount, and total separately."""
+        Args:
+            ticket_data: Output of _prepare_ticket_data
 
-        formatted_ticket = self.openai_client.format_response(
-            data=ticket_data,
-            format_instruction=format_instruction,
-            temperature=0.5  # Moderate creativity while maintaining structure
-        )
+        Returns:
+            Formatted ticket as string
+        """
+        lines = [
+            _TICKET_RULE,
+            "✈️  E-TICKET / BOARDING PASS",
+            _TICKET_RULE,
+            "",
+            f"🎫 BOOKING REFERENCE (PNR):  {ticket_data['booking_reference']}",
+            f"📌 Status: {ticket_data['status']}",
+            f"📅 Booked On: {ticket_data['booking_date']}",
+            "",
+            "👤 PASSENGER INFORMATION",
+            _TICKET_DIVIDER,
+        ]
 
-        return formatted_ticket
+        for i, passenger in enumerate(ticket_data["passengers"], start=1):
+            lines.append(f"  {i}. {passenger['name']} ({passenger['gender']})")
+            lines.append(f"     ID: {passenger['id_type']} {passenger['id_number']}")
+            lines.append(f"     Email: {passenger['email']}")
+            lines.append(f"     Phone: {passenger['phone']}")
+
+        stops = ticket_data["stops"]
+        lines += [
+            "",
+            "✈️  FLIGHT DETAILS",
+            _TICKET_DIVIDER,
+            f"  Route: {ticket_data['route']}",
+            f"  Carrier: {ticket_data['carrier_summary']}",
+        ]
+
+        for segment in ticket_data["segments"]:
+            # ISO timestamps (YYYY-MM-DDTHH:MM:SS) shown as "YYYY-MM-DD HH:MM"
+            departure = segment["departure"].replace("T", " ")[:16]
+            arrival = segment["arrival"].replace("T", " ")[:16]
+            lines.append(
+                f"  Segment {segment['segment_number']}: {segment['carrier']} "
+                f"Flight {segment['flight_number']}"
+            )
+            lines.append(f"     Departs: {segment['from']}  {departure}")
+            lines.append(f"     Arrives: {segment['to']}  {arrival}")
+            lines.append(f"     Duration: {segment['duration']}  |  Aircraft: {segment['aircraft']}")
+
+        lines += [
+            f"  Total Duration: {ticket_data['total_duration']}",
+            f"  Stops: {'Direct flight' if stops == 0 else f'{stops} stop(s)'}",
+            f"  Class: {ticket_data['booking_class']}",
+            "",
+            "💰 PRICE BREAKDOWN",
+            _TICKET_DIVIDER,
+            f"  {'Base Fare:':<16}{ticket_data['base_fare']}",
+            f"  {'GST (' + ticket_data['gst_rate'] + '):':<16}{ticket_data['gst_amount']}",
+            f"  {'TOTAL AMOUNT:':<16}{ticket_data['total_price']}",
+            "",
+            *_TICKET_IMPORTANT_INFO,
+            _TICKET_RULE,
+        ]
+
+        return "\n".join(lines)
 
     def _prepare_ticket_data(self, booking: BookingConfirmation) -> Dict[str, Any]:
         """
@@ -154,40 +261,40 @@ IMPORTANT: Always show the price breakdown with base fare, GST amount, and total
         gst_amount = round(display_price * (settings.gst_rate / 100), 2)
         total_with_gst = round(display_price + gst_amount, 2)
 
+        # One formatter for every amount shown on the ticket
         currency_symbol = get_currency_symbol(display_currency)
+        format_money = f"{currency_symbol}{{:.2f}} {display_currency}".format
 
         # Get route information
         first_segment = flight.segments[0]
         last_segment = flight.segments[-1]
 
-        # Format passenger list
-        passengers_formatted = []
-        for passenger in booking.passengers:
-            passengers_formatted.append({
+        # Format passenger list (contact/ID fields dumped straight from the model)
+        passengers_formatted = [
+            {
                 "name": f"{passenger.first_name} {passenger.last_name}",
-                "gender": passenger.gender,
-                "id_type": passenger.id_type,
-                "id_number": passenger.id_number,
-                "email": passenger.email,
-                "phone": passenger.phone
-            })
+                **passenger.model_dump(include=_PASSENGER_TICKET_FIELDS)
+            }
+            for passenger in booking.passengers
+        ]
 
         # Format flight segments with full carrier name and code
-        segments_formatted = []
-        for i, segment in enumerate(flight.segments, start=1):
-            segments_formatted.append({
+        segments_formatted = [
+            {
                 "segment_number": i,
                 "carrier": f"{segment.carrier_name} ({segment.carrier_code})",
                 "carrier_full": segment.carrier_name,
                 "carrier_code": segment.carrier_code,
                 "flight_number": segment.flight_number,
-                "from": f"{segment.departure_airport}",
-                "to": f"{segment.arrival_airport}",
+                "from": segment.departure_airport,
+                "to": segment.arrival_airport,
                 "departure": segment.departure_time,
                 "arrival": segment.arrival_time,
                 "duration": segment.duration,
                 "aircraft": segment.aircraft or "N/A"
-            })
+            }
+            for i, segment in enumerate(flight.segments, start=1)
+        ]
 
         ticket_data = {
             "booking_reference": booking.booking_reference,
@@ -199,10 +306,10 @@ IMPORTANT: Always show the price breakdown with base fare, GST amount, and total
             "total_duration": flight.total_duration,
             "stops": flight.number_of_stops,
             "booking_class": flight.booking_class,
-            "base_fare": f"{currency_symbol}{display_price:.2f} {display_currency}",
+            "base_fare": format_money(display_price),
             "gst_rate": f"{settings.gst_rate}%",
-            "gst_amount": f"{currency_symbol}{gst_amount:.2f} {display_currency}",
-            "total_price": f"{currency_symbol}{total_with_gst:.2f} {display_currency}",
+            "gst_amount": format_money(gst_amount),
+            "total_price": format_money(total_with_gst),
             "carrier_summary": flight.get_carrier_names()
         }
 
@@ -8,6 +8,12 @@ This client handles:
 4. Flight booking operations
 """
 
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from amadeus import Client, ResponseError
 from typing import List, Optional
 from datetime import datetime, timedelta
@@ -23,9 +29,23 @@ from models.flight_models import (
 )
 from config import settings
 from utils.logger import setup_logger
+from utils.cache import ttl_cache
 
 logger = setup_logger(__name__)
 
+# Sort/min key for flight offers
+_BY_PRICE = attrgetter("price")
+
+# Days around the requested date searched for cheaper alternatives
+ALTERNATIVE_DAY_OFFSETS = (-1, 1)
+
+# Airport -> city names rarely change; cache them for a day
+AIRPORT_CITY_CACHE_SIZE = 4096
+AIRPORT_CITY_CACHE_TTL = 86400
+
+# ISO 8601 time-only durations as returned by Amadeus (e.g. 'PT2H30M')
+_ISO_DURATION_RE = re.compile(r'^PT(?:(\d+)H)?(?:(\d+)M)?$')
+
 
 class AmadeusClient:
     """Client for interacting with Amadeus Flight API."""
@@ -109,14 +129,13 @@ class AmadeusClient:
                 max=request.max_results
             )
 
-            # Parse the response into our models
-            offers = []
-            for offer_data in response.data:
-                offer = self._parse_flight_offer(offer_data)
-                if offer:
-                    offers.append(offer)
+            # Carrier names live in the response-level dictionaries, shared by all offers
+            result = response.result or {}
+            carriers = result.get('dictionaries', {}).get('carriers', {})
 
-            return offers
+            # Parse the response into our models, stopping once enough offers are usable
+            parsed = (self._parse_flight_offer(offer_data, carriers) for offer_data in response.data)
+            return list(islice(filter(None, parsed), request.max_results))
 
         except ResponseError as error:
             logger.warning(f"No flights found for {request.departure_date}: {error}")
@@ -141,24 +160,33 @@ class AmadeusClient:
             return []
 
         # Get the cheapest price from original date
-        min_original_price = min(offer.price for offer in original_offers)
+        min_original_price = min(original_offers, key=_BY_PRICE).price
 
-        alternative_offers = []
-
-        # Check day before and day after
-        for day_offset in [-1, 1]:
-            alternative_date = request.departure_date + timedelta(days=day_offset)
+        # Already cheap enough: skip the two extra round trips
+        if min_original_price <= settings.alt_date_skip_price:
+            logger.debug(
+                f"Cheapest fare {min_original_price} is within the skip threshold "
+                f"{settings.alt_date_skip_price}; not searching alternative dates"
+            )
+            return []
 
-            # Create new request for alternative date
+        # Build requests for the day before and day after
+        alt_requests = []
+        for day_offset in ALTERNATIVE_DAY_OFFSETS:
             alt_request = request.model_copy()
-            alt_request.departure_date = alternative_date
+            alt_request.departure_date = request.departure_date + timedelta(days=day_offset)
+            alt_requests.append(alt_request)
 
-            # Search flights for alternative date
-            alt_offers = self._search_flights_for_date(alt_request)
+        # Search both dates concurrently (independent, I/O-bound round trips)
+        with ThreadPoolExecutor(max_workers=len(alt_requests)) as executor:
+            alt_results = list(executor.map(self._search_flights_for_date, alt_requests))
 
+        alternative_offers = []
+
+        for alt_request, alt_offers in zip(alt_requests, alt_results):
             if alt_offers:
                 # Get cheapest price for this date
-                min_alt_price = min(offer.price for offer in alt_offers)
+                min_alt_price = min(alt_offers, key=_BY_PRICE).price
 
                 # Only include if it's cheaper
                 if min_alt_price < min_original_price:
@@ -166,7 +194,7 @@ class AmadeusClient:
 
                     alternative_offers.append(
                         AlternativeDateOffer(
-                            departure_date=alternative_date,
+                            departure_date=alt_request.departure_date,
                             offers=alt_offers[:3],  # Top 3 cheapest
                             price_difference=price_diff
                         )
@@ -174,12 +202,13 @@ class AmadeusClient:
 
         return alternative_offers
 
-    def _parse_flight_offer(self, offer_data: dict) -> Optional[FlightOffer]:
+    def _parse_flight_offer(self, offer_data: dict, carriers: dict) -> Optional[FlightOffer]:
         """
         Parse raw Amadeus API response into FlightOffer model.
 
         Args:
             offer_data: Raw flight offer data from Amadeus
+            carriers: Carrier code -> name map from the response dictionaries
 
         Returns:
             FlightOffer object or None if parsing fails
@@ -199,7 +228,7 @@ class AmadeusClient:
                 total_duration = self._format_duration(total_duration)
 
                 for segment_data in itinerary['segments']:
-                    segment = self._parse_segment(segment_data, offer_data)
+                    segment = self._parse_segment(segment_data, carriers)
                     if segment:
                         segments.append(segment)
                         number_of_stops += 1
@@ -227,20 +256,15 @@ class AmadeusClient:
             logger.warning(f"Failed to parse flight offer: {e}")
             return None
 
-    def _parse_segment(self, segment_data: dict, offer_data: dict) -> Optional[FlightSegment]:
-        """Parse a single flight segment."""
+    def _parse_segment(self, segment_data: dict, carriers: dict) -> Optional[FlightSegment]:
+        """Parse a single flight segment, naming its carrier from the carriers map."""
         try:
             # Get carrier information
             carrier_code = segment_data['carrierCode']
             flight_number = segment_data['number']
 
-            # Extract carrier name from dictionaries in the response
-            carrier_name = carrier_code  # Default to code
-            if 'dictionaries' in offer_data and 'carriers' in offer_data['dictionaries']:
-                carrier_name = offer_data['dictionaries']['carriers'].get(
-                    carrier_code,
-                    carrier_code
-                )
+            # Carrier name from the response dictionaries, defaulting to the code
+            carrier_name = carriers.get(carrier_code, carrier_code)
 
             # Parse times
             departure_time = segment_data['departure']['at']
@@ -266,6 +290,7 @@ class AmadeusClient:
             return None
 
     @staticmethod
+    @lru_cache(maxsize=2048)
     def _format_duration(iso_duration: str) -> str:
         """
         Convert ISO 8601 duration to human-readable format.
@@ -276,24 +301,13 @@ class AmadeusClient:
         Returns:
             Formatted duration (e.g., '2h 30m')
         """
-        try:
-            # Remove 'PT' prefix
-            duration = iso_duration.replace('PT', '')
-
-            hours = 0
-            minutes = 0
-
-            if 'H' in duration:
-                hours = int(duration.split('H')[0])
-                duration = duration.split('H')[1]
-
-            if 'M' in duration:
-                minutes = int(duration.replace('M', ''))
+        match = _ISO_DURATION_RE.match(iso_duration)
+        if not match:
+            return iso_duration
 
-            return f"{hours}h {minutes}m"
+        hours, minutes = match.groups()
 
-        except Exception:
-            return iso_duration
+        return f"{int(hours or 0)}h {int(minutes or 0)}m"
 
     def book_flight(self, booking_request: BookingRequest) -> BookingConfirmation:
         """
@@ -362,16 +376,48 @@ class AmadeusClient:
             City name
         """
         try:
-            response = self.client.reference_data.locations.get(
-                keyword=iata_code,
-                subType='AIRPORT'
-            )
-
-            if response.data:
-                return response.data[0]['address']['cityName']
-
-            return iata_code
+            return self._lookup_airport_city(iata_code)
 
         except Exception as e:
             logger.warning(f"Could not fetch city for {iata_code}: {e}")
             return iata_code
+
+    @ttl_cache(
+        maxsize=AIRPORT_CITY_CACHE_SIZE,
+        ttl=AIRPORT_CITY_CACHE_TTL,
+        key=lambda self, iata_code: iata_code.strip().upper()
+    )
+    def _lookup_airport_city(self, iata_code: str) -> str:
+        """Fetch the city for an IATA code (memoized; errors propagate uncached)."""
+        response = self.client.reference_data.locations.get(
+            keyword=iata_code,
+            subType='AIRPORT'
+        )
+
+        if response.data:
+            return response.data[0]['address']['cityName']
+
+        return iata_code
+
+
+_shared_client: Optional[AmadeusClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_amadeus_client() -> AmadeusClient:
+    """
+    Get the process-wide Amadeus client.
+
+    The underlying SDK client caches its OAuth access token and refreshes it
+    lazily on expiry, so sharing one instance means a single token fetch for
+    all agents and tools instead of one per instance.
+
+    Returns:
+        Shared AmadeusClient
+    """
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = AmadeusClient()
+    return _shared_client
@@ -7,8 +7,10 @@ This client provides:
 3. Token management
 """
 
-from openai import OpenAI, OpenAIError
-from typing import Optional, Type, TypeVar, List, Dict, Any
+from functools import lru_cache
+import httpx
+from openai import OpenAI, AsyncOpenAI, OpenAIError
+from typing import Optional, Type, TypeVar, List, Dict, Any, Iterator
 from pydantic import BaseModel
 from config import settings
 from utils.logger import setup_logger
@@ -17,6 +19,127 @@ logger = setup_logger(__name__)
 
 T = TypeVar('T', bound=BaseModel)
 
+# Connection pool shared by every OpenAI client in the process
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+HTTP_TIMEOUT = 30.0
+
+# Retries for transient failures (429, 5xx, timeouts, connection errors);
+# the SDK backs off exponentially with jitter between attempts
+MAX_RETRIES = 5
+
+_shared_openai: Optional[OpenAI] = None
+_shared_async_openai: Optional[AsyncOpenAI] = None
+
+
+def get_shared_openai() -> OpenAI:
+    """
+    Get the process-wide synchronous OpenAI client.
+
+    All agents share one pooled HTTP client so keep-alive connections
+    are reused instead of paying a TLS handshake per agent.
+
+    Returns:
+        Shared OpenAI client
+    """
+    global _shared_openai
+    if _shared_openai is None:
+        _shared_openai = OpenAI(
+            api_key=settings.openai_api_key,
+            max_retries=MAX_RETRIES,
+            http_client=httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        )
+    return _shared_openai
+
+
+def get_shared_async_openai() -> AsyncOpenAI:
+    """
+    Get the process-wide asynchronous OpenAI client.
+
+    Returns:
+        Shared AsyncOpenAI client
+    """
+    global _shared_async_openai
+    if _shared_async_openai is None:
+        _shared_async_openai = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            max_retries=MAX_RETRIES,
+            http_client=httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        )
+    return _shared_async_openai
+
+
+def _make_schema_strict(node: Any) -> None:
+    """Recursively adapt a Pydantic JSON schema node to Structured Outputs strict mode."""
+    if isinstance(node, list):
+        for item in node:
+            _make_schema_strict(item)
+        return
+    if not isinstance(node, dict):
+        return
+
+    # Strict mode requires every property and rejects defaults/extra keys
+    node.pop("default", None)
+    node.pop("title", None)
+
+    properties = node.get("properties")
+    if isinstance(properties, dict):
+        node["required"] = list(properties)
+        node["additionalProperties"] = False
+        for prop in properties.values():
+            _make_schema_strict(prop)
+
+    for keyword in ("items", "anyOf", "allOf", "oneOf"):
+        if keyword in node:
+            _make_schema_strict(node[keyword])
+
+    for definition in node.get("$defs", {}).values():
+        _make_schema_strict(definition)
+
+
+@lru_cache(maxsize=None)
+def strict_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Build an OpenAI Structured Outputs `json_schema` payload for a Pydantic model.
+
+    The schema is generated once per model class and the same (read-only)
+    dictionary is returned on later calls.
+
+    Args:
+        model: Pydantic model class describing the expected response
+
+    Returns:
+        Dictionary for `response_format={"type": "json_schema", "json_schema": ...}`
+    """
+    schema = model.model_json_schema()
+    _make_schema_strict(schema)
+
+    return {
+        "name": model.__name__,
+        "schema": schema,
+        "strict": True
+    }
+
+
+def _structured_response_format(model: Type[BaseModel], strict: bool) -> Dict[str, Any]:
+    """Build the response_format for a structured call (strict schema or JSON mode)."""
+    if not strict:
+        return {"type": "json_object"}
+    return {"type": "json_schema", "json_schema": strict_json_schema(model)}
+
+
+def _parse_structured_message(message: Any, model: Type[T]) -> T:
+    """
+    Validate a structured-output message into `model`.
+
+    Raises:
+        ValueError: If the model refused or returned no content
+    """
+    if not message.content:
+        raise ValueError(
+            f"No structured output returned: {getattr(message, 'refusal', None) or 'empty response'}"
+        )
+    return model.model_validate_json(message.content)
+
 
 class OpenAIClient:
     """Wrapper for OpenAI API with helper methods."""
@@ -24,7 +147,7 @@ class OpenAIClient:
     def __init__(self):
         """Initialize OpenAI client with API key from config."""
         try:
-            self.client = OpenAI(api_key=settings.openai_api_key)
+            self.client = get_shared_openai()
             self.model = settings.openai_model
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client: {e}")
@@ -35,7 +158,8 @@ class OpenAIClient:
         messages: List[Dict[str, str]],
         response_model: Type[T],
         temperature: float = 0.7,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        strict_schema: bool = True
     ) -> T:
         """
         Generate structured output using OpenAI with Pydantic model validation.
@@ -45,6 +169,8 @@ class OpenAIClient:
             response_model: Pydantic model class for structured output
             temperature: Sampling temperature (0.0 to 2.0)
             max_tokens: Maximum tokens to generate
+            strict_schema: Enforce response_model's schema server-side (Structured
+                Outputs); False falls back to plain JSON mode for older models
 
         Returns:
             Instance of response_model with parsed data
@@ -53,22 +179,20 @@ class OpenAIClient:
             OpenAIError: If API call fails
         """
         try:
-            logger.debug(f"Generating structured output with model: {response_model.__name__}")
+            logger.debug("Generating structured output with model: %s", response_model.__name__)
 
-            # Use structured outputs (JSON mode)
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
-                response_format={"type": "json_object"}
+                response_format=_structured_response_format(response_model, strict_schema)
             )
 
             # Parse the JSON response into the Pydantic model
-            content = response.choices[0].message.content
-            result = response_model.model_validate_json(content)
+            result = _parse_structured_message(response.choices[0].message, response_model)
 
-            logger.debug(f"Successfully generated structured output")
+            logger.debug("Successfully generated structured output")
             return result
 
         except OpenAIError as error:
@@ -113,7 +237,7 @@ class OpenAIClient:
             )
 
             content = response.choices[0].message.content
-            logger.debug(f"Generated completion: {len(content)} characters")
+            logger.debug("Generated completion: %d characters", len(content))
 
             return content
 
@@ -162,7 +286,8 @@ class OpenAIClient:
         self,
         data: Any,
         format_instruction: str,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
     ) -> str:
         """
         Format data into human-readable text using LLM.
@@ -171,6 +296,7 @@ class OpenAIClient:
             data: Data to format (will be converted to string)
             format_instruction: Instructions for formatting
             temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
 
         Returns:
             Formatted text
@@ -188,5 +314,72 @@ class OpenAIClient:
 
         return self.chat_completion(
             messages=messages,
-            temperature=temperature
+            temperature=temperature,
+            max_tokens=max_tokens
         )
+
+    def stream_response(
+        self,
+        data: Any,
+        format_instruction: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Format data into human-readable text, yielding text as it is generated.
+
+        Args:
+            data: Data to format (will be converted to string)
+            format_instruction: Instructions for formatting
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Text deltas in generation order
+        """
+        messages = [
+            {
+                "role": "system",
+                "content": format_instruction
+            },
+            {
+                "role": "user",
+                "content": str(data)
+            }
+        ]
+
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except OpenAIError as error:
+            logger.error(f"OpenAI API error: {error}")
+            raise
+
+
+_shared_client: Optional[OpenAIClient] = None
+
+
+def get_openai_client() -> OpenAIClient:
+    """
+    Get the process-wide OpenAIClient wrapper.
+
+    The wrapper holds no per-agent state, so every agent can share one
+    instance on top of the pooled OpenAI clients.
+
+    Returns:
+        Shared OpenAIClient
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = OpenAIClient()
+    return _shared_client
@@ -31,6 +31,12 @@ class Settings(BaseSettings):
     # Tax Configuration
     gst_rate: float = 18.0  # GST/Tax rate in percentage (18% = 18.0)
 
+    # Search Configuration
+    alt_date_skip_price: float = 0.0  # Skip ±1 day searches when the cheapest fare (API currency) is at or below this; 0 = always search
+
+    # Ticket Configuration
+    use_llm_ticket_renderer: bool = False  # Format tickets with the LLM instead of the built-in template
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -3,11 +3,28 @@ Generate a beautiful flowchart for AI Ticket Booking System workflow.
 This creates a clean, professional flow diagram showing the user journey.
 """
 
+import hashlib
+import sys
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")  # Headless backend: we only write a PNG, no GUI needed
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.patches import FancyBboxPatch, FancyArrowPatch, Rectangle, Circle
 import matplotlib.lines as mlines
 
+output_file = 'AI_Ticket_Booking_Flowchart.png'
+
+# Skip rendering when the existing PNG was produced by this exact script
+SOURCE_HASH = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+if Path(output_file).exists():
+    from PIL import Image  # Pillow ships with matplotlib
+    with Image.open(output_file) as existing:
+        if existing.info.get("src_hash") == SOURCE_HASH:
+            print("Flowchart is up to date: " + output_file)
+            sys.exit(0)
+
 # Create figure
 fig, ax = plt.subplots(1, 1, figsize=(14, 18))
 ax.set_xlim(0, 14)
@@ -257,8 +274,8 @@ plt.text(13.5, 0.1, 'AI Ticket Booking System 2025',
 plt.tight_layout()
 
 # Save
-output_file = 'AI_Ticket_Booking_Flowchart.png'
-plt.savefig(output_file, dpi=300, bbox_inches='tight', facecolor='white')
+plt.savefig(output_file, dpi=300, bbox_inches='tight', facecolor='white',
+            metadata={'src_hash': SOURCE_HASH})
 print("Flowchart diagram created successfully!")
 print("File: " + output_file)
 print("Resolution: 4200x5400 pixels (14x18 inches @ 300 DPI)")
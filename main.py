@@ -5,14 +5,14 @@ This script initializes the booking workflow and handles user interactions.
 
 import asyncio
 import sys
-import io
 
 # Fix Windows console encoding issues - MUST be before any imports that might print
+# (reconfigure keeps the existing streams' line buffering and tty detection)
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
-from workflows.booking_workflow import BookingWorkflow
+from utils.exceptions import BookingCancelled
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -31,9 +31,6 @@ async def main():
     print("\nYou can type 'cancel' at any time to exit the program")
     print("="*60)
 
-    # Initialize the booking workflow
-    workflow = BookingWorkflow()
-
     # Example user prompt
     user_prompt = input("\nEnter your flight booking request: ").strip()
 
@@ -42,6 +39,12 @@ async def main():
         print("\nGoodbye! Come back anytime to book your flights.")
         return
 
+    # Import and initialize the booking workflow only once there is a request;
+    # the agent/LLM stack is slow to import and would delay the welcome banner
+    from workflows.booking_workflow import BookingWorkflow
+
+    workflow = BookingWorkflow()
+
     try:
         # Execute the workflow
         result = await workflow.run(user_prompt)
@@ -50,7 +53,7 @@ async def main():
         print("BOOKING COMPLETED")
         print("="*50)
 
-    except KeyboardInterrupt:
+    except (BookingCancelled, KeyboardInterrupt):
         print("\n" + "="*50)
         print("BOOKING CANCELLED")
         print("="*50)
@@ -4,10 +4,14 @@ Data models for flight information and booking.
 These Pydantic models ensure type safety and validation throughout the application.
 """
 
+from functools import cached_property
+from operator import attrgetter
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime, date, time
 
+from tools.currency_converter_tool import convert_currency, format_price
+
 
 class FlightSegment(BaseModel):
     """Represents a single flight segment."""
@@ -35,10 +39,14 @@ class FlightOffer(BaseModel):
     booking_class: str = Field(description="Booking class (Economy, Business, etc.)")
     available_seats: Optional[int] = Field(default=None, description="Number of available seats")
 
+    @cached_property
+    def carrier_names(self) -> str:
+        """Comma-separated list of unique carrier names in segment order, computed once per offer."""
+        return ", ".join(dict.fromkeys(segment.carrier_name for segment in self.segments))
+
     def get_carrier_names(self) -> str:
         """Get comma-separated list of unique carrier names."""
-        carriers = list(set(segment.carrier_name for segment in self.segments))
-        return ", ".join(carriers)
+        return self.carrier_names
     
     def convert_currency(self, target_currency: str) -> Optional['FlightOffer']:
         """
@@ -50,8 +58,6 @@ class FlightOffer(BaseModel):
         Returns:
             New FlightOffer with converted price, or None if conversion fails
         """
-        from tools.currency_converter_tool import convert_currency
-        
         if self.currency == target_currency:
             return self
         
@@ -62,12 +68,11 @@ class FlightOffer(BaseModel):
                 target_currency
             )
             
-            # Create a copy with converted price
-            offer_dict = self.model_dump()
-            offer_dict['price'] = converted_price
-            offer_dict['currency'] = target_currency
-            
-            return FlightOffer.model_validate(offer_dict)
+            # Shallow copy with the converted price; the offer was validated on
+            # construction, so segments are shared instead of re-validated
+            return self.model_copy(
+                update={'price': converted_price, 'currency': target_currency}
+            )
         except ValueError:
             return None
     
@@ -81,8 +86,6 @@ class FlightOffer(BaseModel):
         Returns:
             Formatted price string
         """
-        from tools.currency_converter_tool import format_price
-
         return format_price(self.price, self.currency, show_code)
 
     def calculate_gst(self, gst_rate: float) -> float:
@@ -131,6 +134,11 @@ class AlternativeDateOffer(BaseModel):
 
     model_config = {"populate_by_name": True}
 
+    @cached_property
+    def cheapest_offer(self) -> FlightOffer:
+        """Cheapest offer for this date, computed once per object."""
+        return min(self.offers, key=attrgetter("price"))
+
 
 class FlightSearchResponse(BaseModel):
     """Complete response from flight search including alternatives."""
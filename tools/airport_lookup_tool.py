@@ -6,12 +6,24 @@ Can be used by AI agents to resolve city names to airport codes.
 Fetches real-time data from Amadeus Location API only.
 """
 
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from pydantic import BaseModel, Field
+from utils.exceptions import BookingCancelled
 from utils.logger import setup_logger
+from utils.cache import ttl_cache
 
 logger = setup_logger(__name__)
 
+# Serializes interactive airport selection when lookups run concurrently
+_selection_lock = threading.Lock()
+
+# Airport codes are stable, so Amadeus location results are reused for a day
+AIRPORT_CACHE_SIZE = 512
+AIRPORT_CACHE_TTL = 86400
+
 
 class AirportInfo(BaseModel):
     """Airport information model."""
@@ -31,11 +43,19 @@ class AirportLookupTool:
     """
 
     @classmethod
+    @ttl_cache(
+        maxsize=AIRPORT_CACHE_SIZE,
+        ttl=AIRPORT_CACHE_TTL,
+        key=lambda cls, city_or_code: city_or_code.strip().lower(),
+        cache_if=bool
+    )
     def _fetch_airport_from_amadeus(cls, city_or_code: str) -> List[AirportInfo]:
         """
         Fetch airport information from Amadeus API.
 
         Uses the Amadeus Location Search API to find airports by city name or IATA code.
+        Non-empty results are cached per normalized keyword, so the lookup helpers
+        below share one API call per city or code; not-found lookups are retried.
 
         Args:
             city_or_code: City name or IATA code to search
@@ -44,10 +64,10 @@ class AirportLookupTool:
             List of AirportInfo objects found
         """
         try:
-            from api.amadeus_client import AmadeusClient
+            from api.amadeus_client import get_amadeus_client
 
             logger.debug(f"Searching Amadeus API for airports: {city_or_code}")
-            amadeus = AmadeusClient()
+            amadeus = get_amadeus_client()
 
             # Use Amadeus Reference Data API - Locations endpoint
             response = amadeus.client.reference_data.locations.get(
@@ -158,8 +178,7 @@ class AirportLookupTool:
             return None
 
         # Return first major airport, or first airport if no major ones
-        major_airports = [a for a in airports if a.is_major]
-        return major_airports[0] if major_airports else airports[0]
+        return next((a for a in airports if a.is_major), airports[0])
 
     @classmethod
     def format_airports_list(cls, airports: List[AirportInfo]) -> str:
@@ -249,33 +268,54 @@ def get_primary_airport(city_name: str) -> str:
     if len(airports) == 1:
         return airports[0].iata_code
     
-    # Multiple airports found - ask user to select
-    print(f"\n🛫 Multiple airports found for '{city_name}':")
-    print("=" * 70)
-    for idx, airport in enumerate(airports, 1):
-        major_tag = " ⭐ [MAJOR]" if airport.is_major else ""
-        print(f"{idx}. {airport.iata_code} - {airport.airport_name}{major_tag}")
-        print(f"   📍 {airport.city}, {airport.country}")
-        print()
+    # Multiple airports found - ask user to select (one prompt at a time)
+    with _selection_lock:
+        print(f"\n🛫 Multiple airports found for '{city_name}':")
+        print("=" * 70)
+        for idx, airport in enumerate(airports, 1):
+            major_tag = " ⭐ [MAJOR]" if airport.is_major else ""
+            print(f"{idx}. {airport.iata_code} - {airport.airport_name}{major_tag}")
+            print(f"   📍 {airport.city}, {airport.country}")
+            print()
     
-    while True:
-        try:
-            choice = input(f"Select airport (1-{len(airports)}) or 'cancel' to exit: ").strip()
+        while True:
+            try:
+                choice = input(f"Select airport (1-{len(airports)}) or 'cancel' to exit: ").strip()
             
-            if choice.lower() in ['cancel', 'exit', 'quit']:
-                raise KeyboardInterrupt("User cancelled airport selection")
+                if choice.lower() in ['cancel', 'exit', 'quit']:
+                    raise BookingCancelled("User cancelled airport selection")
             
-            choice_num = int(choice)
-            if 1 <= choice_num <= len(airports):
-                selected_airport = airports[choice_num - 1]
-                print(f"✅ Selected: {selected_airport.iata_code} - {selected_airport.airport_name}\n")
-                return selected_airport.iata_code
-            else:
-                print(f"❌ Invalid choice. Please enter a number between 1 and {len(airports)}")
-        except ValueError:
-            print("❌ Invalid input. Please enter a number.")
-        except KeyboardInterrupt:
-            raise
+                choice_num = int(choice)
+                if 1 <= choice_num <= len(airports):
+                    selected_airport = airports[choice_num - 1]
+                    print(f"✅ Selected: {selected_airport.iata_code} - {selected_airport.airport_name}\n")
+                    return selected_airport.iata_code
+                else:
+                    print(f"❌ Invalid choice. Please enter a number between 1 and {len(airports)}")
+            except ValueError:
+                print("❌ Invalid input. Please enter a number.")
+
+
+def get_primary_airports_batch(cities: List[str]) -> str:
+    """
+    Get the primary airport IATA codes for several cities in one tool call.
+
+    Each city is resolved through get_primary_airport;
+    lookups run in parallel.
+
+    Args:
+        cities: City names to resolve (e.g., ['Mumbai', 'Delhi'])
+
+    Returns:
+        JSON object mapping each city name to its IATA code or error message
+    """
+    if not cities:
+        return "{}"
+
+    with ThreadPoolExecutor(max_workers=len(cities)) as executor:
+        codes = list(executor.map(get_primary_airport, cities))
+
+    return json.dumps(dict(zip(cities, codes)))
 
 
 # Export tool definitions for LangChain/OpenAI function calling
@@ -314,6 +354,24 @@ AIRPORT_TOOLS = [
             }
         }
     },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_primary_airports_batch",
+            "description": "Get the primary airport IATA codes for several cities at once. Prefer this to resolve origin and destination in a single call.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "cities": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "City names to resolve (e.g., ['Mumbai', 'Delhi'])"
+                    }
+                },
+                "required": ["cities"]
+            }
+        }
+    },
     {
         "type": "function",
         "function": {
@@ -338,5 +396,6 @@ AIRPORT_TOOLS = [
 TOOL_FUNCTIONS = {
     "lookup_airport_by_code": lookup_airport_by_code,
     "lookup_airports_by_city": lookup_airports_by_city,
-    "get_primary_airport": get_primary_airport
+    "get_primary_airport": get_primary_airport,
+    "get_primary_airports_batch": get_primary_airports_batch
 }
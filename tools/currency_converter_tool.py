@@ -3,16 +3,21 @@ Currency Converter Tool
 
 This tool provides currency conversion functionality for flight prices.
 Can be used as a standalone function or by AI agents for currency conversion.
-Fetches real-time exchange rates from API only.
+Fetches real-time exchange rates from API only (cached briefly per base currency).
 """
 
 import requests
 from typing import Dict, Optional
 from utils.logger import setup_logger
+from utils.cache import ttl_cache
 from config import settings
 
 logger = setup_logger(__name__)
 
+# Rates move slowly; one fetch per base currency serves a whole search
+EXCHANGE_RATE_CACHE_SIZE = 32
+EXCHANGE_RATE_CACHE_TTL = 300  # seconds
+
 
 class CurrencyConverterTool:
     """
@@ -22,9 +27,14 @@ class CurrencyConverterTool:
     """
 
     @classmethod
+    @ttl_cache(
+        maxsize=EXCHANGE_RATE_CACHE_SIZE,
+        ttl=EXCHANGE_RATE_CACHE_TTL,
+        key=lambda cls, base_currency="USD": base_currency.upper()
+    )
     def _fetch_exchange_rates(cls, base_currency: str = "USD") -> Dict[str, float]:
         """
-        Fetch current exchange rates from API.
+        Fetch current exchange rates from API (memoized for EXCHANGE_RATE_CACHE_TTL).
         
         Args:
             base_currency: Base currency for rates (default: USD)
@@ -83,7 +93,7 @@ class CurrencyConverterTool:
         Raises:
             Exception: If API call fails or currencies not found
         """
-        # Fetch fresh rates from API
+        # Fetch rates from API (or the short-lived cache)
         rates = cls._fetch_exchange_rates(from_currency)
         
         # Try to get rate from response
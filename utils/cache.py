@@ -0,0 +1,67 @@
+"""
+Lightweight in-process caching helpers.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable, Optional
+
+
+def ttl_cache(
+    maxsize: int = 128,
+    ttl: float = 3600,
+    key: Optional[Callable[..., Hashable]] = None,
+    cache_if: Optional[Callable[[Any], bool]] = None
+) -> Callable:
+    """
+    Memoize a function with LRU eviction and per-entry expiry.
+
+    Thread-safe, so cached functions can be called from worker threads.
+    Exceptions are not cached.
+
+    Args:
+        maxsize: Maximum number of cached entries
+        ttl: Time-to-live for each entry in seconds
+        key: Optional function building the cache key from the call arguments
+        cache_if: Optional predicate on the result; results it rejects are not cached
+
+    Returns:
+        Decorator producing the cached function
+    """
+    def decorator(func: Callable) -> Callable:
+        entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            with lock:
+                entry = entries.get(cache_key)
+                if entry is not None and entry[0] > now:
+                    entries.move_to_end(cache_key)
+                    return entry[1]
+
+            result = func(*args, **kwargs)
+            if cache_if is not None and not cache_if(result):
+                return result
+
+            with lock:
+                entries[cache_key] = (now + ttl, result)
+                entries.move_to_end(cache_key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+
+            return result
+
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,12 @@
+"""
+Exceptions shared across agents, tools and the workflow.
+"""
+
+
+class BookingCancelled(Exception):
+    """
+    Raised when the user cancels the booking at an interactive prompt.
+
+    A regular exception (unlike KeyboardInterrupt) so it propagates cleanly
+    out of LangGraph tasks and worker threads to main.py.
+    """
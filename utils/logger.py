@@ -3,14 +3,20 @@ Logging configuration for the application.
 """
 
 import logging
+from functools import lru_cache
+
 import colorlog
 from config import settings
 
 
+@lru_cache(maxsize=None)
 def setup_logger(name: str) -> logging.Logger:
     """
     Set up a colored logger with the specified name.
 
+    Memoized, so repeated calls for the same name return the configured
+    logger without touching its level or handlers again.
+
     Args:
         name: The name of the logger (usually __name__)
 
@@ -22,6 +22,8 @@ from agents.presentation_agent import FlightPresentationAgent
 from agents.booking_agent import BookingAgent
 from agents.ticket_generation_agent import TicketGenerationAgent
 from agents.notification_agent import NotificationAgent
+from models.flight_models import BookingConfirmation, FlightOffer, FlightSearchResponse, PassengerInfo
+from utils.exceptions import BookingCancelled
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -39,18 +41,18 @@ class BookingState(TypedDict, total=False):
     # Agent 1 outputs
     parsed_request: Dict[str, Any]
     search_request: Dict[str, Any]
-    flight_results: Dict[str, Any]
+    flight_results: FlightSearchResponse
 
     # Agent 2 outputs
     presentation: str
 
     # User selection
-    selected_offer: Dict[str, Any]
+    selected_offer: FlightOffer
     selection_number: int
 
     # Agent 3 outputs
-    passengers: list[Dict[str, Any]]
-    booking_confirmation: Dict[str, Any]
+    passengers: list[PassengerInfo]
+    booking_confirmation: BookingConfirmation
 
     # Agent 4 outputs
     formatted_ticket: str
@@ -123,13 +125,15 @@ class BookingWorkflow:
 
     # Node functions - these wrap each agent's execute method
 
-    def _search_node(self, state: BookingState) -> BookingState:
+    async def _search_node(self, state: BookingState) -> BookingState:
         """Node for Flight Search Agent."""
         logger.info("Executing search node...")
         try:
-            state = self.search_agent.execute(state["user_prompt"], state)
+            state = await self.search_agent.execute(state["user_prompt"], state)
             state.setdefault("messages", []).append("Flight search completed")
             return state
+        except BookingCancelled:
+            raise
         except Exception as e:
             logger.error(f"Search node failed: {e}")
             state["error"] = str(e)
@@ -156,6 +160,8 @@ class BookingWorkflow:
                 f"User selected option {state.get('selection_number')}"
             )
             return state
+        except BookingCancelled:
+            raise
         except Exception as e:
             logger.error(f"Selection node failed: {e}")
             state["error"] = str(e)
@@ -168,6 +174,8 @@ class BookingWorkflow:
             state = self.booking_agent.execute(state)
             state.setdefault("messages", []).append("Booking completed")
             return state
+        except BookingCancelled:
+            raise
         except Exception as e:
             logger.error(f"Booking node failed: {e}")
             state["error"] = str(e)
@@ -208,6 +216,7 @@ class BookingWorkflow:
             Final state with booking confirmation
 
         Raises:
+            BookingCancelled: If the user cancels at any prompt
             Exception: If any agent fails
         """
         logger.info(f"Starting workflow with prompt: {user_prompt}")
@@ -223,7 +232,7 @@ class BookingWorkflow:
 
         try:
             final_state = None
-            for state in self.graph.stream(initial_state, config):
+            async for state in self.graph.astream(initial_state, config):
                 # Stream returns dict with node name as key
                 logger.debug(f"Current state: {list(state.keys())}")
                 final_state = state
@@ -235,9 +244,9 @@ class BookingWorkflow:
             logger.info("Workflow completed successfully")
             return final_state
 
-        except KeyboardInterrupt:
+        except (BookingCancelled, KeyboardInterrupt):
             logger.info("Workflow cancelled by user")
-            # Re-raise KeyboardInterrupt to be handled by main.py
+            # Re-raise so main.py can report the cancellation
             raise
             
         except Exception as e: